@@ -0,0 +1,18 @@
+"""
+_numba_compat.py
+----------------------------------------------------------------------
+Optional numba import shared by the compiled-kernel modules.
+
+Without numba, njit returns the function unchanged and prange is
+range, so the kernels run as plain Python.
+"""
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
@@ -0,0 +1,115 @@
+"""
+_sim_kernel.py
+----------------------------------------------------------------------
+Compiled inner loop for the SUHS-MRV facility simulation.
+
+The week-to-week working-gas inventory and cycle-mass ramping are
+inherently sequential, so they cannot be expressed as plain NumPy
+array operations. This module holds that recurrence as a scalar loop
+over pre-drawn arrays and compiles it with numba when available.
+
+Only NumPy arrays and floats cross this boundary; all pandas and
+datetime handling stays in generator.py.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from _numba_compat import njit
+
+
+# Mode indices used by mode_idx arrays
+MODE_INJECTION_HEAVY = 0
+MODE_WITHDRAWAL_HEAVY = 1
+MODE_BALANCED = 2
+
+
+@njit(cache=True)
+def run_inventory(
+    is_active: np.ndarray,
+    target_frac_in: np.ndarray,
+    mode_idx: np.ndarray,
+    heavy_aux: np.ndarray,
+    balanced_eps: np.ndarray,
+    loss_fraction: np.ndarray,
+    static_leak_per_week: float,
+    working_capacity_kg: float,
+    working_gas0_kg: float,
+    cap_min: float,
+    cap_max: float,
+    max_delta: float,
+    last_frac0: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Step the working-gas inventory through all weeks of one facility.
+
+    Inputs are length-n arrays of pre-drawn random values; only entries
+    at active weeks are consumed. The ramping constraint, mode split,
+    dynamic losses and the clamp-and-rebalance of withdrawals and
+    injections follow the original per-week loop exactly.
+
+    Returns:
+      working_gas, h2_injected, h2_withdrawn, dynamic_losses,
+      realized_frac
+    """
+    n = is_active.shape[0]
+    working_gas = np.empty(n)
+    h2_inj = np.zeros(n)
+    h2_wdr = np.zeros(n)
+    dyn_losses = np.zeros(n)
+    realized_frac = np.empty(n)
+
+    wg = working_gas0_kg
+    last_frac = last_frac0
+
+    for i in range(n):
+        # Static leak applies every week
+        wg = max(wg - static_leak_per_week, 0.0)
+
+        if is_active[i]:
+            # Enforce ramping on the cycle mass fraction
+            delta = target_frac_in[i] - last_frac
+            delta = max(-max_delta, min(delta, max_delta))
+            frac = last_frac + delta
+            last_frac = max(cap_min, min(frac, cap_max))
+
+            target_mass = working_capacity_kg * last_frac
+            mode = mode_idx[i]
+            if mode == MODE_INJECTION_HEAVY:
+                inj = target_mass
+                wdr = target_mass * heavy_aux[i]
+            elif mode == MODE_WITHDRAWAL_HEAVY:
+                wdr = target_mass
+                inj = target_mass * heavy_aux[i]
+            else:
+                eps = balanced_eps[i] * target_mass
+                inj = max(target_mass + eps, 0.0)
+                wdr = max(target_mass - eps, 0.0)
+
+            if wg <= 0.0 or loss_fraction[i] <= 0.0:
+                dyn = 0.0
+            else:
+                dyn = wg * loss_fraction[i]
+
+            wg = wg + inj - wdr - dyn - static_leak_per_week
+
+            # Clamp to [0, capacity]: reduce withdrawals, then injections
+            if wg < 0.0:
+                wdr -= min(-wg, wdr)
+                wg = 0.0
+
+            if wg > working_capacity_kg:
+                inj -= min(wg - working_capacity_kg, inj)
+                wg = working_capacity_kg
+
+            h2_inj[i] = inj
+            h2_wdr[i] = wdr
+            dyn_losses[i] = dyn
+
+        working_gas[i] = wg
+        realized_frac[i] = last_frac
+
+    return working_gas, h2_inj, h2_wdr, dyn_losses, realized_frac
@@ -5,11 +5,16 @@ Generate the Synthetic Underground Hydrogen Storage MRV (SUHS-MRV)
 dataset using the configuration in config/uhs_config.yaml and the
 physics helpers in physics.py.
 
-Outputs three CSV files under data/generated/:
+Outputs three tables under data/generated/, as CSV (default) or
+Parquet files:
 
-  - facility_metadata.csv
-  - facility_timeseries.csv
-  - cycle_summary.csv
+  - facility_metadata
+  - facility_timeseries
+  - cycle_summary
+
+A Parquet copy of the outputs is cached under data/generated/.cache/,
+keyed on the config and generator sources, so unchanged inputs are not
+simulated again.
 
 This module is designed to be readable and reproducible so that the
 generation procedure can be described clearly in the accompanying paper.
@@ -17,14 +22,31 @@ generation procedure can be described clearly in the accompanying paper.
 
 from __future__ import annotations
 
+import hashlib
 import os
-from datetime import datetime, timedelta
-from typing import Dict, Any, Tuple
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Dict, Any, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pa_parquet
+except ImportError:  # pyarrow is optional; only needed for Parquet output
+    pa = None
+
 from physics import (
     build_thermo_config,
     build_temperature_noise_config,
@@ -37,14 +59,11 @@ from physics import (
     PurityConfig,
     ValidationConfig,
     compute_temperature_c,
+    make_pressure_bounds,
     mass_from_pvt,
-    pressure_from_mass,
-    sample_loss_fraction,
-    compute_cycle_losses_kg,
-    sample_inlet_purity_pct,
-    update_purity_out_pct,
-    mass_balance_residual_fraction,
+    pressure_from_mass_vec,
 )
+from _sim_kernel import run_inventory
 
 
 # ---------------------------------------------------------------------
@@ -52,9 +71,34 @@ from physics import (
 # ---------------------------------------------------------------------
 
 
+# Parsed configs keyed by absolute path -> (mtime, size, cfg)
+_YAML_CACHE: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_MAX_ENTRIES = 100
+
+
 def load_config(path: str = "config/uhs_config.yaml") -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        cfg = yaml.safe_load(f)
+    """
+    Load a YAML config, reusing the parsed result while the file's
+    mtime and size are unchanged.
+
+    The returned dict is shared between calls and must not be mutated.
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime, st.st_size)
+
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[:2] == stamp:
+        _YAML_CACHE.move_to_end(key)
+        return cached[2]
+
+    with open(key, "r", encoding="utf-8") as f:
+        cfg = yaml.load(f, Loader=_YamlLoader)
+
+    _YAML_CACHE[key] = (stamp[0], stamp[1], cfg)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+        _YAML_CACHE.popitem(last=False)
     return cfg
 
 
@@ -63,17 +107,43 @@ def load_config(path: str = "config/uhs_config.yaml") -> Dict[str, Any]:
 # ---------------------------------------------------------------------
 
 
+@dataclass(slots=True)
+class FacilityRow:
+    """One row of facility metadata, in create_facilities column order."""
+
+    facility_id: str
+    facility_type: str
+    country_code: str
+    region: str
+    latitude: float
+    longitude: float
+    depth_m: float
+    cavern_volume_m3: float
+    porosity: float
+    permeability_mD: float
+    pressure_min_mpa: float
+    pressure_max_mpa: float
+
+
+FACILITY_COLUMNS = tuple(f.name for f in fields(FacilityRow))
+
+
 def _sample_lognormal_bounded(
     rng: np.random.Generator,
     mean: float,
     sigma: float,
     min_val: float,
     max_val: float,
-) -> float:
-    """Sample from a lognormal and clip to [min_val, max_val]."""
-    value = rng.lognormal(mean=np.log(mean), sigma=sigma)
-    value = max(min_val, min(value, max_val))
-    return float(value)
+    size: Optional[int] = None,
+) -> Union[float, np.ndarray]:
+    """
+    Sample from a lognormal and clip to [min_val, max_val].
+    Returns an array of ``size`` draws if ``size`` is given.
+    """
+    value = np.clip(rng.lognormal(np.log(mean), sigma, size=size), min_val, max_val)
+    if size is None:
+        return float(value)
+    return value
 
 
 def _sample_uniform(
@@ -109,91 +179,88 @@ def create_facilities(
     salt_cfg = cfg["facility_types"]["salt_cavern"]
     porous_cfg = cfg["facility_types"]["porous_reservoir"]
 
-    rows = []
-
-    for i in range(n_facilities):
-        facility_type = rng.choice(facility_types, p=type_probs)
-
-        country_code = rng.choice(countries)
-        region = rng.choice(regions)
-        latitude = float(rng.uniform(-60.0, 60.0))
-        longitude = float(rng.uniform(-180.0, 180.0))
-
-        if facility_type == "salt_cavern":
-            depth = _sample_uniform(
-                rng,
-                salt_cfg["depth_m"]["min"],
-                salt_cfg["depth_m"]["max"],
-            )
-            # Cavern volume from configured lognormal distribution
-            cav_conf = salt_cfg["cavern_volume_m3"]
-            cavern_volume_m3 = _sample_lognormal_bounded(
-                rng,
-                mean=cav_conf["mean"],
-                sigma=cav_conf["sigma"],
-                min_val=cav_conf["min"],
-                max_val=cav_conf["max"],
-            )
-            porosity = np.nan
-            permeability = np.nan
-            pmin = salt_cfg["pressure_min_mpa"]
-            pmax = salt_cfg["pressure_max_mpa"]
-
-        else:  # porous_reservoir
-            depth = _sample_uniform(
-                rng,
-                porous_cfg["depth_m"]["min"],
-                porous_cfg["depth_m"]["max"],
-            )
-            poro_conf = porous_cfg["porosity"]
-            perm_conf = porous_cfg["permeability_mD"]
-
-            porosity = _sample_uniform(
-                rng,
-                poro_conf["min"],
-                poro_conf["max"],
-            )
-            permeability = _sample_lognormal_bounded(
-                rng,
-                mean=perm_conf["mean"],
-                sigma=perm_conf["sigma"],
-                min_val=perm_conf["min"],
-                max_val=perm_conf["max"],
-            )
-
-            # For porous reservoirs, approximate an effective storage volume
-            # by sampling from the same distribution used for caverns.
-            # This represents an equivalent pore volume for storage.
-            cav_conf = salt_cfg["cavern_volume_m3"]
-            cavern_volume_m3 = _sample_lognormal_bounded(
-                rng,
-                mean=cav_conf["mean"],
-                sigma=cav_conf["sigma"],
-                min_val=cav_conf["min"],
-                max_val=cav_conf["max"],
-            )
-
-            pmin = porous_cfg["pressure_min_mpa"]
-            pmax = porous_cfg["pressure_max_mpa"]
-
-        rows.append(
-            {
-                "facility_id": f"UHS_{i+1:03d}",
-                "facility_type": facility_type,
-                "country_code": country_code,
-                "region": region,
-                "latitude": latitude,
-                "longitude": longitude,
-                "depth_m": depth,
-                "cavern_volume_m3": cavern_volume_m3,
-                "porosity": porosity,
-                "permeability_mD": permeability,
-                "pressure_min_mpa": pmin,
-                "pressure_max_mpa": pmax,
-            }
-        )
+    n = n_facilities
+    facility_type = rng.choice(facility_types, size=n, p=type_probs)
+    country_code = rng.choice(countries, size=n)
+    region = rng.choice(regions, size=n)
+    latitude = rng.uniform(-60.0, 60.0, size=n)
+    longitude = rng.uniform(-180.0, 180.0, size=n)
+
+    depth = np.empty(n)
+    cavern_volume_m3 = np.empty(n)
+    porosity = np.full(n, np.nan)
+    permeability = np.full(n, np.nan)
+    pmin = np.empty(n)
+    pmax = np.empty(n)
+
+    salt = facility_type == "salt_cavern"
+    porous = ~salt
+    n_salt = int(salt.sum())
+    n_porous = n - n_salt
+
+    # Cavern volume from configured lognormal distribution
+    cav_conf = salt_cfg["cavern_volume_m3"]
+
+    depth[salt] = rng.uniform(
+        salt_cfg["depth_m"]["min"], salt_cfg["depth_m"]["max"], size=n_salt
+    )
+    cavern_volume_m3[salt] = _sample_lognormal_bounded(
+        rng,
+        mean=cav_conf["mean"],
+        sigma=cav_conf["sigma"],
+        min_val=cav_conf["min"],
+        max_val=cav_conf["max"],
+        size=n_salt,
+    )
+    pmin[salt] = salt_cfg["pressure_min_mpa"]
+    pmax[salt] = salt_cfg["pressure_max_mpa"]
+
+    poro_conf = porous_cfg["porosity"]
+    perm_conf = porous_cfg["permeability_mD"]
 
-    df = pd.DataFrame(rows)
+    depth[porous] = rng.uniform(
+        porous_cfg["depth_m"]["min"], porous_cfg["depth_m"]["max"], size=n_porous
+    )
+    porosity[porous] = rng.uniform(poro_conf["min"], poro_conf["max"], size=n_porous)
+    permeability[porous] = _sample_lognormal_bounded(
+        rng,
+        mean=perm_conf["mean"],
+        sigma=perm_conf["sigma"],
+        min_val=perm_conf["min"],
+        max_val=perm_conf["max"],
+        size=n_porous,
+    )
+    # For porous reservoirs, approximate an effective storage volume
+    # by sampling from the same distribution used for caverns.
+    # This represents an equivalent pore volume for storage.
+    cavern_volume_m3[porous] = _sample_lognormal_bounded(
+        rng,
+        mean=cav_conf["mean"],
+        sigma=cav_conf["sigma"],
+        min_val=cav_conf["min"],
+        max_val=cav_conf["max"],
+        size=n_porous,
+    )
+    pmin[porous] = porous_cfg["pressure_min_mpa"]
+    pmax[porous] = porous_cfg["pressure_max_mpa"]
+
+    df = pd.DataFrame(
+        {
+            "facility_id": [f"UHS_{i+1:03d}" for i in range(n)],
+            # Low-cardinality labels stored as categoricals
+            "facility_type": pd.Categorical(facility_type, categories=facility_types),
+            "country_code": pd.Categorical(country_code, categories=countries),
+            "region": pd.Categorical(region, categories=regions),
+            "latitude": latitude,
+            "longitude": longitude,
+            "depth_m": depth,
+            "cavern_volume_m3": cavern_volume_m3,
+            "porosity": porosity,
+            "permeability_mD": permeability,
+            "pressure_min_mpa": pmin,
+            "pressure_max_mpa": pmax,
+        }
+    )
     return df
 
 
@@ -209,10 +276,8 @@ def generate_time_index(
     """
     Generate a weekly time index for the full simulation period.
     """
-    start = datetime.fromisoformat(start_date)
-    n_weeks = n_years * 52
-    dates = [start + timedelta(weeks=i) for i in range(n_weeks)]
-    return pd.DatetimeIndex(dates)
+    # "7D" keeps the start date as the anchor; "W" would snap to Sundays
+    return pd.date_range(start=start_date, periods=n_years * 52, freq="7D")
 
 
 def assign_active_cycles_per_year(
@@ -248,14 +313,109 @@ def assign_active_cycles_per_year(
     return year_active_indices
 
 
+def build_active_mask(
+    time_index: pd.DatetimeIndex,
+    year_active_indices: Dict[int, np.ndarray],
+) -> np.ndarray:
+    """
+    Flatten the per-year active week indices into a boolean mask over
+    time_index, so per-week activity checks are O(1).
+    """
+    mask = np.zeros(len(time_index), dtype=bool)
+    for active in year_active_indices.values():
+        mask[active] = True
+    return mask
+
+
 # ---------------------------------------------------------------------
 # FACILITY-LEVEL SIMULATION
 # ---------------------------------------------------------------------
 
+# Output columns (in order) and the dtype of each column array.
+# facility_id repeats per row, so it is stored as a categorical.
+TIMESERIES_COLUMNS: Dict[str, Any] = {
+    "facility_id": "category",
+    "timestamp": "datetime64[ns]",
+    "cycle_index": np.int64,
+    "is_cycle_active": np.bool_,
+    "h2_injected_kg": np.float64,
+    "h2_withdrawn_kg": np.float64,
+    "working_gas_kg": np.float64,
+    "cushion_gas_kg": np.float64,
+    "losses_kg": np.float64,
+    "pressure_mpa": np.float64,
+    "temperature_c": np.float64,
+    "purity_in_pct": np.float64,
+    "purity_out_pct": np.float64,
+    "cycle_efficiency": np.float64,
+}
+
+CYCLE_SUMMARY_COLUMNS: Dict[str, Any] = {
+    "facility_id": "category",
+    "cycle_index": np.int64,
+    "cycle_start": "datetime64[ns]",
+    "cycle_end": "datetime64[ns]",
+    "total_injected_kg": np.float64,
+    "total_withdrawn_kg": np.float64,
+    "total_losses_kg": np.float64,
+    "avg_pressure_mpa": np.float64,
+    "avg_temperature_c": np.float64,
+    "cycle_efficiency": np.float64,
+}
+
+
+def _with_float_dtype(schema: Dict[str, Any], dtype: Any) -> Dict[str, Any]:
+    """Return schema with every float64 column switched to dtype."""
+    return {name: (dtype if dt is np.float64 else dt) for name, dt in schema.items()}
+
+
+def _columns_to_frame(
+    columns: Dict[str, np.ndarray],
+    schema: Dict[str, Any],
+    copy: bool = True,
+) -> pd.DataFrame:
+    """Wrap column arrays in a DataFrame, ordered and typed by schema."""
+    data = {}
+    for name, dt in schema.items():
+        if isinstance(dt, str) and dt == "category":
+            data[name] = pd.Categorical(columns[name])
+        else:
+            data[name] = np.asarray(columns[name], dtype=dt)
+    return pd.DataFrame(data, copy=copy)
+
+
+@dataclass(slots=True)
+class FacilityTypeParams:
+    """Per-facility-type constants used by the simulation."""
+
+    working_frac: float
+    base_temperature_c: float
+    gradient_c_per_km: float
+    pressure_max_mpa: float
+
+
+def _facility_type_params(cfg: Dict[str, Any], facility_type: str) -> FacilityTypeParams:
+    """
+    Resolve the config constants for one facility type, so the
+    salt/porous branch is taken once per facility.
+    """
+    if facility_type == "salt_cavern":
+        fcfg = cfg["facility_types"]["salt_cavern"]
+        working_frac = fcfg["working_gas_fraction_of_total"]
+    else:
+        fcfg = cfg["facility_types"]["porous_reservoir"]
+        working_frac = fcfg["working_gas_fraction_of_pore_volume"]
+    return FacilityTypeParams(
+        working_frac=working_frac,
+        base_temperature_c=fcfg["base_temperature_c"],
+        gradient_c_per_km=fcfg["temperature_gradient_c_per_km"],
+        pressure_max_mpa=fcfg["pressure_max_mpa"],
+    )
+
 
 def _compute_facility_capacity_kg(
-    facility_row: pd.Series,
-    cfg: Dict[str, Any],
+    facility: FacilityRow,
+    type_params: FacilityTypeParams,
     thermo_cfg: ThermoConfig,
     temp_noise_cfg: TemperatureNoiseConfig,
     rng: np.random.Generator,
@@ -266,48 +426,34 @@ def _compute_facility_capacity_kg(
     Returns:
       working_capacity_kg, cushion_gas_kg
     """
-    ftype = facility_row["facility_type"]
-    depth_m = float(facility_row["depth_m"])
-    volume_m3 = float(facility_row["cavern_volume_m3"])
-
-    if ftype == "salt_cavern":
-        fcfg = cfg["facility_types"]["salt_cavern"]
-        working_frac = fcfg["working_gas_fraction_of_total"]
-        base_T = fcfg["base_temperature_c"]
-        grad = fcfg["temperature_gradient_c_per_km"]
-        pmax = fcfg["pressure_max_mpa"]
-    else:
-        fcfg = cfg["facility_types"]["porous_reservoir"]
-        working_frac = fcfg["working_gas_fraction_of_pore_volume"]
-        base_T = fcfg["base_temperature_c"]
-        grad = fcfg["temperature_gradient_c_per_km"]
-        pmax = fcfg["pressure_max_mpa"]
+    depth_m = float(facility.depth_m)
+    volume_m3 = float(facility.cavern_volume_m3)
 
     # Use a representative reservoir temperature at depth
     temp_c = compute_temperature_c(
         depth_m=depth_m,
-        base_temperature_c=base_T,
-        gradient_c_per_km=grad,
+        base_temperature_c=type_params.base_temperature_c,
+        gradient_c_per_km=type_params.gradient_c_per_km,
         noise_cfg=temp_noise_cfg,
         rng=rng,
     )
 
     # Total gas mass at maximum pressure (simplified)
     total_mass_kg = mass_from_pvt(
-        pressure_mpa=pmax,
+        pressure_mpa=type_params.pressure_max_mpa,
         temperature_c=temp_c,
         volume_m3=volume_m3,
         thermo=thermo_cfg,
     )
 
-    working_capacity_kg = max(total_mass_kg * working_frac, 0.0)
+    working_capacity_kg = max(total_mass_kg * type_params.working_frac, 0.0)
     cushion_gas_kg = max(total_mass_kg - working_capacity_kg, 0.0)
 
     return working_capacity_kg, cushion_gas_kg
 
 
 def simulate_facility_timeseries(
-    facility_row: pd.Series,
+    facility: FacilityRow,
     cfg: Dict[str, Any],
     thermo_cfg: ThermoConfig,
     temp_noise_cfg: TemperatureNoiseConfig,
@@ -315,7 +461,7 @@ def simulate_facility_timeseries(
     purity_cfg: PurityConfig,
     val_cfg: ValidationConfig,
     time_index: pd.DatetimeIndex,
-    year_active_indices: Dict[int, np.ndarray],
+    active_mask: np.ndarray,
     rng: np.random.Generator,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
@@ -324,45 +470,77 @@ def simulate_facility_timeseries(
     Returns:
       timeseries_df, cycle_summary_df
     """
-    ftype = facility_row["facility_type"]
-    depth_m = float(facility_row["depth_m"])
-    volume_m3 = float(facility_row["cavern_volume_m3"])
+    ts_cols, cycle_cols = simulate_facility_columns(
+        facility=facility,
+        cfg=cfg,
+        thermo_cfg=thermo_cfg,
+        temp_noise_cfg=temp_noise_cfg,
+        loss_cfg=loss_cfg,
+        purity_cfg=purity_cfg,
+        val_cfg=val_cfg,
+        time_index=time_index,
+        active_mask=active_mask,
+        rng=rng,
+    )
+    return (
+        _columns_to_frame(ts_cols, TIMESERIES_COLUMNS),
+        _columns_to_frame(cycle_cols, CYCLE_SUMMARY_COLUMNS),
+    )
 
-    if ftype == "salt_cavern":
-        fcfg = cfg["facility_types"]["salt_cavern"]
-    else:
-        fcfg = cfg["facility_types"]["porous_reservoir"]
 
-    base_T = fcfg["base_temperature_c"]
-    grad = fcfg["temperature_gradient_c_per_km"]
-    pmin = float(facility_row["pressure_min_mpa"])
-    pmax = float(facility_row["pressure_max_mpa"])
+def simulate_facility_columns(
+    facility: FacilityRow,
+    cfg: Dict[str, Any],
+    thermo_cfg: ThermoConfig,
+    temp_noise_cfg: TemperatureNoiseConfig,
+    loss_cfg: LossConfig,
+    purity_cfg: PurityConfig,
+    val_cfg: ValidationConfig,
+    time_index: pd.DatetimeIndex,
+    active_mask: np.ndarray,
+    rng: np.random.Generator,
+    out: Optional[Dict[str, np.ndarray]] = None,
+) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """
+    Simulate one facility and return its output as column arrays keyed
+    by TIMESERIES_COLUMNS and CYCLE_SUMMARY_COLUMNS names.
+
+    All random inputs are drawn up front as length-n_weeks arrays; the
+    sequential inventory recurrence runs in _sim_kernel.run_inventory.
+
+    If ``out`` is given, it maps timeseries column names to length-n_weeks
+    arrays (e.g. slices of a larger preallocated array); those columns
+    are written into it in place and it is returned as the first
+    element. Columns missing from ``out`` are not returned.
+
+    Returns:
+      timeseries_columns, cycle_summary_columns
+    """
+    depth_m = float(facility.depth_m)
+    volume_m3 = float(facility.cavern_volume_m3)
+
+    type_params = _facility_type_params(cfg, facility.facility_type)
+    base_T = type_params.base_temperature_c
+    grad = type_params.gradient_c_per_km
+    pmin = float(facility.pressure_min_mpa)
+    pmax = float(facility.pressure_max_mpa)
 
     cyc_cfg = cfg["cycling"]
     dist_cfg = cfg["distributions"]
 
     working_capacity_kg, cushion_gas_kg = _compute_facility_capacity_kg(
-        facility_row, cfg, thermo_cfg, temp_noise_cfg, rng
+        facility, type_params, thermo_cfg, temp_noise_cfg, rng
     )
 
-    # Initialize states
-    working_gas_kg = working_capacity_kg * 0.5  # start half full
     static_leak_per_year = _sample_uniform(
-    rng,
-    loss_cfg.static_leak_min_kg_per_year,
-    loss_cfg.static_leak_max_kg_per_year,
-)
+        rng,
+        loss_cfg.static_leak_min_kg_per_year,
+        loss_cfg.static_leak_max_kg_per_year,
+    )
     static_leak_per_week = static_leak_per_year / 52.0
 
     injection_mean = dist_cfg["injection_mass_kg"]["relative_mean"]
     injection_sigma = dist_cfg["injection_mass_kg"]["relative_sigma"]
-    inj_min_frac = dist_cfg["injection_mass_kg"]["min_fraction_of_capacity"]
-    inj_max_frac = dist_cfg["injection_mass_kg"]["max_fraction_of_capacity"]
-
-    withdrawal_mean = dist_cfg["withdrawal_mass_kg"]["relative_mean"]
-    withdrawal_sigma = dist_cfg["withdrawal_mass_kg"]["relative_sigma"]
-    wdr_min_frac = dist_cfg["withdrawal_mass_kg"]["min_fraction_of_capacity"]
-    wdr_max_frac = dist_cfg["withdrawal_mass_kg"]["max_fraction_of_capacity"]
 
     pressure_noise_mean = dist_cfg["pressure_noise_mpa"]["mean"]
     pressure_noise_std = dist_cfg["pressure_noise_mpa"]["std"]
@@ -372,7 +550,7 @@ def simulate_facility_timeseries(
     cap_max_frac = cyc_cfg["cycle_mass_fraction_of_capacity"]["max"]
 
     mode_mix = cyc_cfg["mode_mix"]
-    mode_choices = ["injection_heavy", "withdrawal_heavy", "balanced"]
+    # Order matches the MODE_* indices in _sim_kernel
     mode_probs = np.array(
         [
             mode_mix["injection_heavy_fraction"],
@@ -383,202 +561,301 @@ def simulate_facility_timeseries(
     )
     mode_probs = mode_probs / mode_probs.sum()
 
-    records = []
-    cycle_records = []
+    n_weeks = len(time_index)
+    is_active = active_mask
+    # Running cycle counter on active weeks, 0 elsewhere
+    cycle_idx = np.where(is_active, np.cumsum(is_active), 0)
+
+    # -----------------------------------------------------------------
+    # Bulk random draws: one uniform and one standard-normal buffer,
+    # mapped to each distribution by its linear transform
+    #   U(a, b) = a + (b - a) * U(0, 1)
+    #   N(mu, s) = mu + s * N(0, 1)
+    #   LogN(ln m, s) = m * exp(s * N(0, 1))
+    # -----------------------------------------------------------------
+    u_mode, u_heavy, u_balanced, u_loss = rng.random((4, n_weeks))
+    z_temp, z_pressure, z_target, z_purity_in, z_purity_out = rng.standard_normal(
+        (5, n_weeks)
+    )
 
-    last_cycle_fraction = 0.1
-    cycle_index = 0
+    # Geothermal temperature at depth is constant per facility; only the
+    # noise term varies week to week
+    temp_at_depth_c = base_T + grad * depth_m / 1000.0
+    if temp_noise_cfg.distribution == "normal":
+        temperature_c = (temp_at_depth_c + temp_noise_cfg.mean) + temp_noise_cfg.std * z_temp
+    else:
+        temperature_c = np.full(n_weeks, temp_at_depth_c)
+
+    pressure_noise = pressure_noise_mean + pressure_noise_std * z_pressure
+    mode_idx = np.searchsorted(np.cumsum(mode_probs)[:-1], u_mode, side="right")
+    # Transforms and clamps below run in place on one temporary each
+    target_frac = injection_sigma * z_target
+    np.exp(target_frac, out=target_frac)
+    target_frac *= injection_mean
+    np.clip(target_frac, cap_min_frac, cap_max_frac, out=target_frac)
+    heavy_aux = 0.1 + 0.5 * u_heavy
+    balanced_eps = -0.1 + 0.2 * u_balanced
+    loss_fraction = loss_cfg.loss_min + (loss_cfg.loss_max - loss_cfg.loss_min) * u_loss
+
+    purity_in_draw = purity_cfg.inlet_std * z_purity_in
+    purity_in_draw += purity_cfg.inlet_mean
+    np.clip(purity_in_draw, purity_cfg.inlet_min, purity_cfg.inlet_max, out=purity_in_draw)
+    # Outlet purity is bounded by [0, 100] and by the inlet range
+    purity_out_draw = purity_cfg.outlet_noise_std * z_purity_out
+    purity_out_draw += purity_cfg.outlet_noise_mean
+    purity_out_draw += purity_in_draw
+    np.clip(purity_out_draw, purity_cfg.clip_lo, purity_cfg.clip_hi, out=purity_out_draw)
+
+    # -----------------------------------------------------------------
+    # Sequential inventory recurrence (compiled kernel)
+    # -----------------------------------------------------------------
+    (
+        working_gas,
+        h2_injected,
+        h2_withdrawn,
+        dynamic_losses,
+        _,
+    ) = run_inventory(
+        is_active,
+        target_frac,
+        mode_idx,
+        heavy_aux,
+        balanced_eps,
+        loss_fraction,
+        static_leak_per_week,
+        working_capacity_kg,
+        working_capacity_kg * 0.5,  # start half full
+        cap_min_frac,
+        cap_max_frac,
+        max_delta_frac,
+        0.1,
+    )
 
-    for idx, ts in enumerate(time_index):
-        year = ts.year
-        active_indices = year_active_indices.get(year, np.array([], dtype=int))
-        is_active = idx in active_indices
-
-        # Base temperature at this time step
-        temperature_c = compute_temperature_c(
-            depth_m=depth_m,
-            base_temperature_c=base_T,
-            gradient_c_per_km=grad,
-            noise_cfg=temp_noise_cfg,
-            rng=rng,
-        )
+    # Compute pressure from current gas inventory (working + cushion)
+    pressure_mpa = pressure_from_mass_vec(
+        mass_kg=working_gas + cushion_gas_kg,
+        temperature_c=temperature_c,
+        volume_m3=volume_m3,
+        thermo=thermo_cfg,
+    )
 
-        # Static leak applies every week
-        working_gas_kg = max(working_gas_kg - static_leak_per_week, 0.0)
-        static_losses_kg = static_leak_per_week
-
-        h2_injected_kg = 0.0
-        h2_withdrawn_kg = 0.0
-        cycle_efficiency = np.nan
-        purity_in_pct = np.nan
-        purity_out_pct = np.nan
-        dynamic_losses_kg = 0.0
-
-        if is_active:
-            cycle_index += 1
-
-            mode = rng.choice(mode_choices, p=mode_probs)
-
-            # Sample target cycle mass fraction and apply ramping constraint
-            target_frac = rng.lognormal(mean=np.log(injection_mean), sigma=injection_sigma)
-            target_frac = max(cap_min_frac, min(target_frac, cap_max_frac))
-            # enforce ramping
-            delta = target_frac - last_cycle_fraction
-            delta = max(-max_delta_frac, min(delta, max_delta_frac))
-            cycle_frac = last_cycle_fraction + delta
-            cycle_frac = max(cap_min_frac, min(cycle_frac, cap_max_frac))
-            last_cycle_fraction = cycle_frac
-
-            target_mass = working_capacity_kg * cycle_frac
-
-            if mode == "injection_heavy":
-                h2_injected_kg = target_mass
-                h2_withdrawn_kg = target_mass * float(rng.uniform(0.1, 0.6))
-            elif mode == "withdrawal_heavy":
-                h2_withdrawn_kg = target_mass
-                h2_injected_kg = target_mass * float(rng.uniform(0.1, 0.6))
-            else:  # balanced
-                base = target_mass
-                eps = float(rng.uniform(-0.1, 0.1)) * target_mass
-                h2_injected_kg = max(base + eps, 0.0)
-                h2_withdrawn_kg = max(base - eps, 0.0)
-
-            # Cycle loss fraction and dynamic losses
-            loss_fraction = sample_loss_fraction(loss_cfg, rng)
-            dynamic_losses_kg = compute_cycle_losses_kg(working_gas_kg, loss_fraction)
-
-            # Update working gas inventory
-            prev_working = working_gas_kg
-            working_gas_kg = (
-                working_gas_kg + h2_injected_kg - h2_withdrawn_kg - dynamic_losses_kg - static_losses_kg
-            )
-
-            # Clamp to [0, capacity] and adjust if needed
-            if working_gas_kg < 0.0:
-                deficit = -working_gas_kg
-                # reduce withdrawals to fix
-                reduction = min(deficit, h2_withdrawn_kg)
-                h2_withdrawn_kg -= reduction
-                working_gas_kg = 0.0
-
-            if working_gas_kg > working_capacity_kg:
-                excess = working_gas_kg - working_capacity_kg
-                # reduce injection to fix
-                reduction = min(excess, h2_injected_kg)
-                h2_injected_kg -= reduction
-                working_gas_kg = working_capacity_kg
-
-            total_cycle_losses_kg = dynamic_losses_kg + static_losses_kg
-            delta_storage_kg = working_gas_kg - prev_working
-
-            # Cycle efficiency and purity
-            if h2_injected_kg > 0:
-                cycle_efficiency = h2_withdrawn_kg / h2_injected_kg
-            else:
-                cycle_efficiency = np.nan
-
-            purity_in_pct = sample_inlet_purity_pct(purity_cfg, rng)
-            purity_out_pct = update_purity_out_pct(
-                purity_in_pct, purity_cfg, rng
-            )
-
-            # Mass balance check (can be used in validation notebook)
-            _ = mass_balance_residual_fraction(
-                injected_kg=h2_injected_kg,
-                withdrawn_kg=h2_withdrawn_kg,
-                losses_kg=total_cycle_losses_kg,
-                delta_storage_kg=delta_storage_kg,
-            )
-
-            cycle_records.append(
-                {
-                    "facility_id": facility_row["facility_id"],
-                    "cycle_index": cycle_index,
-                    "cycle_start": ts,
-                    "cycle_end": ts + timedelta(weeks=1),
-                    "total_injected_kg": h2_injected_kg,
-                    "total_withdrawn_kg": h2_withdrawn_kg,
-                    "total_losses_kg": total_cycle_losses_kg,
-                    "avg_pressure_mpa": np.nan,  # filled below
-                    "avg_temperature_c": temperature_c,
-                    "cycle_efficiency": cycle_efficiency,
-                }
-            )
-        else:
-            # No active cycle this week; only static leak already applied
-            total_cycle_losses_kg = static_losses_kg
-
-        # Compute pressure from current gas inventory (working + cushion)
-        total_gas_kg = working_gas_kg + cushion_gas_kg
-        pressure_mpa = pressure_from_mass(
-            mass_kg=total_gas_kg,
-            temperature_c=temperature_c,
-            volume_m3=volume_m3,
-            thermo=thermo_cfg,
-        )
+    # Add random pressure noise and clamp to facility pressure bounds
+    # with small margin considered in validation
+    pressure_mpa += pressure_noise
+    np.clip(
+        pressure_mpa,
+        *make_pressure_bounds(pmin, pmax, val_cfg.pressure_margin_mpa),
+        out=pressure_mpa,
+    )
 
-        # Add random pressure noise
-        pressure_mpa += float(
-            rng.normal(pressure_noise_mean, pressure_noise_std)
-        )
-        # Clamp to facility pressure bounds with small margin considered in validation
-        pressure_mpa = max(pmin - val_cfg.pressure_margin_mpa, pressure_mpa)
-        pressure_mpa = min(pmax + val_cfg.pressure_margin_mpa, pressure_mpa)
-
-        # If no active cycle, reuse previous purity values if available
-        if not np.isfinite(purity_in_pct):
-            if records:
-                purity_in_pct = records[-1]["purity_in_pct"]
-                purity_out_pct = records[-1]["purity_out_pct"]
+    losses = dynamic_losses + static_leak_per_week
+
+    cycle_efficiency = np.full(n_weeks, np.nan)
+    np.divide(h2_withdrawn, h2_injected, out=cycle_efficiency, where=h2_injected > 0)
+
+    # Inactive weeks reuse the purity of the most recent active week,
+    # or the configured inlet mean before the first cycle.
+    last_active = np.maximum.accumulate(np.where(is_active, np.arange(n_weeks), -1))
+    has_prev = last_active >= 0
+    purity_in_pct = np.where(has_prev, purity_in_draw[last_active], purity_cfg.inlet_mean)
+    purity_out_pct = np.where(has_prev, purity_out_draw[last_active], purity_cfg.inlet_mean)
+
+    # Per-facility constants stay scalar here; they are broadcast into
+    # ``out`` or expanded to full columns only when no ``out`` is given
+    ts_cols = {
+        "facility_id": facility.facility_id,
+        "timestamp": time_index.values,
+        "cycle_index": cycle_idx,
+        "is_cycle_active": is_active,
+        "h2_injected_kg": h2_injected,
+        "h2_withdrawn_kg": h2_withdrawn,
+        "working_gas_kg": working_gas,
+        "cushion_gas_kg": cushion_gas_kg,
+        "losses_kg": losses,
+        "pressure_mpa": pressure_mpa,
+        "temperature_c": temperature_c,
+        "purity_in_pct": purity_in_pct,
+        "purity_out_pct": purity_out_pct,
+        "cycle_efficiency": cycle_efficiency,
+    }
+    if out is not None:
+        for name, col in out.items():
+            col[:] = ts_cols[name]
+        ts_cols = out
+    else:
+        ts_cols["facility_id"] = np.full(n_weeks, facility.facility_id, dtype=object)
+        ts_cols["cushion_gas_kg"] = np.full(n_weeks, cushion_gas_kg)
+
+    # Average pressure per cycle, accumulated by cycle index
+    active_pos = np.flatnonzero(is_active)
+    n_cycles = int(active_pos.size)
+    pressure_sum = np.bincount(
+        cycle_idx[active_pos], weights=pressure_mpa[active_pos], minlength=n_cycles + 1
+    )
+    pressure_count = np.bincount(cycle_idx[active_pos], minlength=n_cycles + 1)
+
+    cycle_start = time_index.values[active_pos]
+    cycle_cols = {
+        "facility_id": np.full(active_pos.size, facility.facility_id, dtype=object),
+        "cycle_index": cycle_idx[active_pos],
+        "cycle_start": cycle_start,
+        "cycle_end": cycle_start + np.timedelta64(7, "D"),
+        "total_injected_kg": h2_injected[active_pos],
+        "total_withdrawn_kg": h2_withdrawn[active_pos],
+        "total_losses_kg": losses[active_pos],
+        "avg_pressure_mpa": pressure_sum[cycle_idx[active_pos]]
+        / pressure_count[cycle_idx[active_pos]],
+        "avg_temperature_c": temperature_c[active_pos],
+        "cycle_efficiency": cycle_efficiency[active_pos],
+    }
+
+    return ts_cols, cycle_cols
+
+
+# ---------------------------------------------------------------------
+# OUTPUT WRITERS
+# ---------------------------------------------------------------------
+
+
+def _arrow_csv_table(frame: pd.DataFrame) -> "pa.Table":
+    """
+    Convert a frame for the pyarrow CSV writer, formatting timestamp
+    columns like the pandas writer: YYYY-MM-DD when every value is at
+    midnight, YYYY-MM-DD HH:MM:SS otherwise.
+    """
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type):
+            column = table.column(i)
+            at_midnight = pa_compute.all(
+                pa_compute.equal(pa_compute.floor_temporal(column, unit="day"), column)
+            ).as_py()
+            if at_midnight is not False:
+                column = column.cast(pa.date32())
             else:
-                # default high purity
-                purity_in_pct = purity_cfg.inlet_mean
-                purity_out_pct = purity_cfg.inlet_mean
-
-        records.append(
-            {
-                "facility_id": facility_row["facility_id"],
-                "timestamp": ts,
-                "cycle_index": cycle_index if is_active else 0,
-                "is_cycle_active": bool(is_active),
-                "h2_injected_kg": h2_injected_kg,
-                "h2_withdrawn_kg": h2_withdrawn_kg,
-                "working_gas_kg": working_gas_kg,
-                "cushion_gas_kg": cushion_gas_kg,
-                "losses_kg": total_cycle_losses_kg,
-                "pressure_mpa": pressure_mpa,
-                "temperature_c": temperature_c,
-                "purity_in_pct": purity_in_pct,
-                "purity_out_pct": purity_out_pct,
-                "cycle_efficiency": cycle_efficiency,
-            }
+                column = pa_compute.strftime(
+                    column.cast(pa.timestamp("s", tz=field.type.tz), safe=False),
+                    format="%Y-%m-%d %H:%M:%S",
+                )
+            table = table.set_column(i, field.name, column)
+    return table
+
+
+def _check_output_options(output_format: str, csv_engine: str) -> None:
+    """
+    Reject unsupported output options, and pyarrow-based output when
+    pyarrow is not installed.
+    """
+    if output_format not in ("csv", "parquet"):
+        raise ValueError(f"Unsupported output_format: {output_format!r}")
+    if csv_engine not in ("pandas", "pyarrow"):
+        raise ValueError(f"Unsupported csv_engine: {csv_engine!r}")
+    if pa is None and output_format == "parquet":
+        raise ImportError("Parquet output requires pyarrow")
+    if pa is None and output_format == "csv" and csv_engine == "pyarrow":
+        raise ImportError('csv_engine="pyarrow" requires pyarrow')
+
+
+def _write_frame(
+    frame: pd.DataFrame,
+    path: str,
+    output_format: str = "csv",
+    csv_engine: str = "pandas",
+) -> None:
+    """
+    Write one output table as CSV or Parquet.
+
+    csv_engine="pandas" keeps the established text format.
+    csv_engine="pyarrow" uses the multithreaded pyarrow CSV writer
+    instead, which is much faster but prints booleans as true/false and
+    whole floats without ".0". Parquet is always written with pyarrow.
+    """
+    _check_output_options(output_format, csv_engine)
+    if output_format == "csv" and csv_engine == "pandas":
+        frame.to_csv(path, index=False)
+    elif output_format == "csv":
+        pa_csv.write_csv(
+            _arrow_csv_table(frame),
+            path,
+            write_options=pa_csv.WriteOptions(
+                quoting_style="none", quoting_header="none"
+            ),
         )
+    else:
+        pa_parquet.write_table(pa.Table.from_pandas(frame, preserve_index=False), path)
 
-    ts_df = pd.DataFrame(records)
-    cycles_df = pd.DataFrame(cycle_records)
 
-    if not cycles_df.empty:
-        # Fill avg_pressure_mpa from timeseries: average over the week where cycle_index matches
-        merged = (
-            ts_df[["facility_id", "timestamp", "cycle_index", "pressure_mpa"]]
-            .copy()
+# Outputs depend on the config and on these modules' code
+_CACHE_SOURCE_FILES = ("generator.py", "physics.py", "_sim_kernel.py")
+_OUTPUT_TABLES = ("facility_metadata", "facility_timeseries", "cycle_summary")
+# Cache entries kept per output_dir; the least recently used are removed
+_CACHE_MAX_ENTRIES = 8
+
+
+def _generation_cache_key(config_path: str, *options: str) -> str:
+    """
+    Content hash of the config file and the simulation sources, plus
+    any generation options that change the stored output.
+    """
+    h = hashlib.sha256()
+    for option in options:
+        h.update(option.encode("utf-8"))
+    with open(config_path, "rb") as f:
+        h.update(f.read())
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in _CACHE_SOURCE_FILES:
+        with open(os.path.join(src_dir, name), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()[:16]
+
+
+def _load_cached_outputs(
+    cache_dir: str,
+) -> Optional[Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
+    """Read cached Parquet outputs, or return None if any is missing or unreadable."""
+    paths = [os.path.join(cache_dir, f"{name}.parquet") for name in _OUTPUT_TABLES]
+    if not all(os.path.exists(path) for path in paths):
+        return None
+    try:
+        facility_df, timeseries_df, cycle_summary_df = (
+            pd.read_parquet(path) for path in paths
         )
-        merged_active = merged[merged["cycle_index"] > 0]
-        if not merged_active.empty:
-            avg_pressures = (
-                merged_active.groupby(["facility_id", "cycle_index"])["pressure_mpa"]
-                .mean()
-                .reset_index()
-                .rename(columns={"pressure_mpa": "avg_pressure_mpa"})
-            )
-            cycles_df = cycles_df.drop(columns=["avg_pressure_mpa"])
-            cycles_df = cycles_df.merge(
-                avg_pressures,
-                on=["facility_id", "cycle_index"],
-                how="left",
-            )
-
-    return ts_df, cycles_df
+    except (OSError, pa.ArrowException):
+        return None
+    # Mark the entry as recently used for _prune_cache
+    os.utime(cache_dir)
+    return facility_df, timeseries_df, cycle_summary_df
+
+
+def _store_cached_outputs(
+    cache_dir: str,
+    outputs: Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame],
+) -> None:
+    """
+    Write outputs as Parquet into the cache. Each file is written under
+    a temporary name and renamed into place, so an interrupted run
+    never leaves a partial cache entry.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    for frame, name in zip(outputs, _OUTPUT_TABLES):
+        path = os.path.join(cache_dir, f"{name}.parquet")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            _write_frame(frame, tmp_path, "parquet")
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def _prune_cache(cache_root: str) -> None:
+    """Remove all but the _CACHE_MAX_ENTRIES most recently used cache entries."""
+    entries = [
+        entry for entry in os.scandir(cache_root) if entry.is_dir(follow_symlinks=False)
+    ]
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in entries[_CACHE_MAX_ENTRIES:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
 
 
 # ---------------------------------------------------------------------
@@ -589,17 +866,68 @@ def simulate_facility_timeseries(
 def generate_uhs_dataset(
     config_path: str = "config/uhs_config.yaml",
     output_dir: str = "data/generated",
+    n_jobs: Optional[int] = 1,
+    output_format: str = "csv",
+    use_cache: bool = True,
+    dtype: str = "float32",
+    csv_engine: str = "pandas",
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     High-level function to generate the full SUHS-MRV dataset.
 
+    Facilities are simulated independently, each with its own random
+    stream spawned from the configured seed, so results do not depend
+    on n_jobs. n_jobs=1 runs in-process; n_jobs=None or n_jobs <= 0 (as
+    in joblib's n_jobs=-1) uses all CPU cores.
+
+    output_format selects "csv" (default) or "parquet" output files.
+    csv_engine="pyarrow" writes the CSV files with pyarrow's writer,
+    which is several times faster for the timeseries; the default
+    "pandas" keeps the established text format.
+
+    dtype sets the storage type of the timeseries float columns. The
+    default "float32" halves their size, which is ample for the
+    precision of the synthetic quantities; pass "float64" to keep
+    full double precision. The simulation itself always runs in float64.
+
+    With use_cache (and pyarrow installed), results are also stored as
+    Parquet under <output_dir>/.cache/<hash>/, keyed on the config file
+    and generator sources; a later run with the same inputs loads them
+    instead of simulating again and rewrites the output files from them.
+    Only the most recently used _CACHE_MAX_ENTRIES entries are kept.
+
     Returns:
       facility_metadata_df, facility_timeseries_df, cycle_summary_df
     """
+    _check_output_options(output_format, csv_engine)
+
+    ext = output_format
+    facility_path = os.path.join(output_dir, f"facility_metadata.{ext}")
+    timeseries_path = os.path.join(output_dir, f"facility_timeseries.{ext}")
+    cycle_path = os.path.join(output_dir, f"cycle_summary.{ext}")
+    output_paths = (facility_path, timeseries_path, cycle_path)
+
+    cache_dir = None
+    if use_cache and pa is not None:
+        cache_dir = os.path.join(
+            output_dir, ".cache", _generation_cache_key(config_path, f"dtype={dtype}")
+        )
+        cached = _load_cached_outputs(cache_dir)
+        if cached is not None:
+            # Rewrite the outputs even if present: they may come from a
+            # different config written into the same output_dir
+            print(f"Loaded cached dataset: {cache_dir}")
+            os.makedirs(output_dir, exist_ok=True)
+            for frame, path in zip(cached, output_paths):
+                _write_frame(frame, path, output_format, csv_engine)
+                print(f"Written: {path}")
+            return cached
+
     cfg = load_config(config_path)
 
     seed = cfg["global"]["random_seed"]
-    rng = np.random.default_rng(seed)
+    seed_seq = np.random.SeedSequence(seed)
+    rng = np.random.default_rng(seed_seq)
 
     thermo_cfg = build_thermo_config(cfg)
     temp_noise_cfg = build_temperature_noise_config(cfg)
@@ -619,62 +947,112 @@ def generate_uhs_dataset(
     year_active_indices = assign_active_cycles_per_year(
         cfg, time_index, rng
     )
+    active_mask = build_active_mask(time_index, year_active_indices)
 
     # 3) Simulate each facility
-    ts_frames = []
-    cycle_frames = []
-
-    for _, row in facility_df.iterrows():
-        ts_df, cycles_df = simulate_facility_timeseries(
-            facility_row=row,
-            cfg=cfg,
-            thermo_cfg=thermo_cfg,
-            temp_noise_cfg=temp_noise_cfg,
-            loss_cfg=loss_cfg,
-            purity_cfg=purity_cfg,
-            val_cfg=val_cfg,
-            time_index=time_index,
-            year_active_indices=year_active_indices,
-            rng=rng,
-        )
-        ts_frames.append(ts_df)
-        cycle_frames.append(cycles_df)
-
-    timeseries_df = pd.concat(ts_frames, ignore_index=True)
+    facilities = [
+        FacilityRow(*row)
+        for row in facility_df[list(FACILITY_COLUMNS)].itertuples(index=False, name=None)
+    ]
+    facility_rngs = [
+        np.random.default_rng(child) for child in seed_seq.spawn(len(facilities))
+    ]
+    sim_kwargs = dict(
+        cfg=cfg,
+        thermo_cfg=thermo_cfg,
+        temp_noise_cfg=temp_noise_cfg,
+        loss_cfg=loss_cfg,
+        purity_cfg=purity_cfg,
+        val_cfg=val_cfg,
+        time_index=time_index,
+        active_mask=active_mask,
+    )
 
-    if cycle_frames:
-        cycle_summary_df = pd.concat(cycle_frames, ignore_index=True)
+    # Every facility yields exactly n_weeks rows, so the combined
+    # timeseries is allocated once and each facility fills its slice.
+    # facility_id is built afterwards from category codes.
+    n_weeks = len(time_index)
+    ts_schema = _with_float_dtype(TIMESERIES_COLUMNS, np.dtype(dtype).type)
+    ts_columns = {
+        name: np.empty(len(facilities) * n_weeks, dtype=dt)
+        for name, dt in ts_schema.items()
+        if name != "facility_id"
+    }
+    slices = [slice(i * n_weeks, (i + 1) * n_weeks) for i in range(len(facilities))]
+
+    if n_jobs == 1:
+        cycle_parts = [
+            simulate_facility_columns(
+                facility=facility,
+                rng=frng,
+                out={name: col[sl] for name, col in ts_columns.items()},
+                **sim_kwargs,
+            )[1]
+            for facility, frng, sl in zip(facilities, facility_rngs, slices)
+        ]
     else:
-        cycle_summary_df = pd.DataFrame(
-            columns=[
-                "facility_id",
-                "cycle_index",
-                "cycle_start",
-                "cycle_end",
-                "total_injected_kg",
-                "total_withdrawn_kg",
-                "total_losses_kg",
-                "avg_pressure_mpa",
-                "avg_temperature_c",
-                "cycle_efficiency",
+        cycle_parts = []
+        if n_jobs is None or n_jobs <= 0:
+            n_jobs = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            futures = [
+                pool.submit(
+                    simulate_facility_columns,
+                    facility=facility,
+                    rng=frng,
+                    **sim_kwargs,
+                )
+                for facility, frng in zip(facilities, facility_rngs)
             ]
+            for future, sl in zip(futures, slices):
+                facility_ts, facility_cycles = future.result()
+                for name, col in ts_columns.items():
+                    col[sl] = facility_ts[name]
+                cycle_parts.append(facility_cycles)
+
+    facility_ids = facility_df["facility_id"].to_numpy()
+    ts_columns["facility_id"] = pd.Categorical.from_codes(
+        np.repeat(np.arange(len(facilities), dtype=np.int32), n_weeks),
+        categories=facility_ids,
+    )
+    timeseries_df = _columns_to_frame(ts_columns, ts_schema, copy=False)
+
+    # Cycle counts vary per facility, so these columns are concatenated
+    if cycle_parts:
+        cycle_columns = {
+            name: np.concatenate([part[name] for part in cycle_parts])
+            for name in CYCLE_SUMMARY_COLUMNS
+            if name != "facility_id"
+        }
+        cycle_columns["facility_id"] = pd.Categorical.from_codes(
+            np.repeat(
+                np.arange(len(facilities), dtype=np.int32),
+                [len(part["cycle_index"]) for part in cycle_parts],
+            ),
+            categories=facility_ids,
+        )
+        cycle_summary_df = _columns_to_frame(
+            cycle_columns, CYCLE_SUMMARY_COLUMNS, copy=False
         )
+    else:
+        cycle_summary_df = pd.DataFrame(columns=list(CYCLE_SUMMARY_COLUMNS))
 
-    # 4) Write to CSV
+    # 4) Write outputs
     os.makedirs(output_dir, exist_ok=True)
-    facility_path = os.path.join(output_dir, "facility_metadata.csv")
-    timeseries_path = os.path.join(output_dir, "facility_timeseries.csv")
-    cycle_path = os.path.join(output_dir, "cycle_summary.csv")
-
-    facility_df.to_csv(facility_path, index=False)
-    timeseries_df.to_csv(timeseries_path, index=False)
-    cycle_summary_df.to_csv(cycle_path, index=False)
+    _write_frame(facility_df, facility_path, output_format, csv_engine)
+    _write_frame(timeseries_df, timeseries_path, output_format, csv_engine)
+    _write_frame(cycle_summary_df, cycle_path, output_format, csv_engine)
 
     print(f"Written: {facility_path}")
     print(f"Written: {timeseries_path}")
     print(f"Written: {cycle_path}")
 
-    return facility_df, timeseries_df, cycle_summary_df
+    outputs = (facility_df, timeseries_df, cycle_summary_df)
+    if cache_dir is not None:
+        _store_cached_outputs(cache_dir, outputs)
+        _prune_cache(os.path.dirname(cache_dir))
+
+    return outputs
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ Hydrogen Storage (UHS) synthetic dataset.
 
 Implements:
 - Temperature vs. depth with noise
-- Compressibility factor Z (piecewise)
+- Compressibility factor Z (piecewise or linear in P)
 - Real-gas relationships (P, V, T, mass)
 - Simple porous-reservoir Darcy-based pressure change helper
 - Loss and purity models
@@ -18,8 +18,9 @@ config/uhs_config.yaml.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Any, List
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Tuple, Union
 
 import math
 import numpy as np
@@ -30,21 +31,103 @@ import numpy as np
 # -------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ThermoConfig:
     gas_constant_R_J_per_molK: float
     molar_mass_H2_kg_per_mol: float
-    compressibility_segments: List[Dict[str, float]]
-
-
-@dataclass
+    # (pressure_min_mpa, pressure_max_mpa, Z) per segment, in config
+    # order; dict-shaped segments as in the YAML are converted on init
+    compressibility_segments: Tuple[Tuple[float, float, float], ...]
+    # "piecewise_constant" uses the segments; "linear" uses
+    # Z(P) = 1 + z_linear_a * P with P in Pa
+    compressibility_model: str = "piecewise_constant"
+    z_linear_a: float = 5.865e-9
+    # Segment bounds and Z sorted by pressure_min_mpa, for binary-search
+    # lookups; derived from compressibility_segments. Arrays serve the
+    # vectorized path, tuples the scalar one.
+    pmin_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    pmax_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    Z_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    Z_fallback: float = field(init=False, repr=False, compare=False)
+    _pmin: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _pmax: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _Z: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    # Direct-indexed lookup on a Z_LUT_RESOLUTION_PER_MPA grid over
+    # [0, Z_LUT_PMAX_MPA): the sorted segment index per bucket (-1 for
+    # the fallback Z, -2 for buckets next to a segment boundary, which
+    # still use the binary search) and the matching Z (NaN for -2)
+    Z_lut: np.ndarray = field(init=False, repr=False, compare=False)
+    _seg_lut: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    # (pmin, pmax, Z) of the segment matched by the previous scalar
+    # lookup; successive calls (e.g. fixed-point iterations) usually
+    # land in the same segment
+    _last_seg: Tuple[float, float, float] = field(
+        init=False, repr=False, compare=False, default=(math.inf, -math.inf, 1.0)
+    )
+    # Gas-constant ratios used by the PVT helpers, so that each call
+    # needs one division instead of two
+    M_over_R: float = field(init=False, repr=False, compare=False)
+    R_over_M: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.compressibility_segments = tuple(
+            (float(s["pressure_min_mpa"]), float(s["pressure_max_mpa"]), float(s["Z"]))
+            if isinstance(s, dict)
+            else tuple(float(v) for v in s)
+            for s in self.compressibility_segments
+        )
+        segs = sorted(self.compressibility_segments)
+        # Lookups return the single segment containing P, so overlapping
+        # segments would make the result depend on search order
+        for (lo, hi, _), (next_lo, next_hi, _) in zip(segs, segs[1:]):
+            if hi > next_lo:
+                raise ValueError(
+                    "Overlapping compressibility segments: "
+                    f"[{lo}, {hi}) and [{next_lo}, {next_hi}) MPa"
+                )
+        self._pmin = tuple(s[0] for s in segs)
+        self._pmax = tuple(s[1] for s in segs)
+        self._Z = tuple(s[2] for s in segs)
+        self.pmin_arr = np.asarray(self._pmin, dtype=np.float64)
+        self.pmax_arr = np.asarray(self._pmax, dtype=np.float64)
+        self.Z_arr = np.asarray(self._Z, dtype=np.float64)
+        self.Z_fallback = self.compressibility_segments[-1][2] if segs else 1.0
+        self._build_z_lut()
+        R = self.gas_constant_R_J_per_molK
+        M = self.molar_mass_H2_kg_per_mol
+        self.M_over_R = M / R
+        self.R_over_M = R / M
+
+    def _build_z_lut(self) -> None:
+        n_buckets = int(Z_LUT_PMAX_MPA * Z_LUT_RESOLUTION_PER_MPA)
+        mids = (np.arange(n_buckets) + 0.5) / Z_LUT_RESOLUTION_PER_MPA
+        seg_lut = np.full(n_buckets, -1, dtype=np.intp)
+        if self._pmin:
+            idx = np.searchsorted(self.pmin_arr, mids, side="right") - 1
+            in_seg = (idx >= 0) & (mids < self.pmax_arr[np.maximum(idx, 0)])
+            seg_lut[in_seg] = idx[in_seg]
+        # A bucket within one step of a boundary may hold pressures from
+        # two segments, allowing for rounding in int(P * resolution)
+        for bound in set(self._pmin + self._pmax):
+            if math.isfinite(bound):
+                k = math.floor(bound * Z_LUT_RESOLUTION_PER_MPA)
+                seg_lut[max(k - 1, 0):max(k + 2, 0)] = -2
+        self._seg_lut = tuple(seg_lut.tolist())
+        Z_lut = np.full(n_buckets, self.Z_fallback)
+        Z_lut[seg_lut == -2] = np.nan
+        if self._pmin:
+            Z_lut[seg_lut >= 0] = self.Z_arr[seg_lut[seg_lut >= 0]]
+        self.Z_lut = Z_lut
+
+
+@dataclass(slots=True)
 class TemperatureNoiseConfig:
     distribution: str
     mean: float
     std: float
 
 
-@dataclass
+@dataclass(slots=True)
 class LossConfig:
     loss_min: float
     loss_max: float
@@ -52,7 +135,7 @@ class LossConfig:
     static_leak_max_kg_per_year: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PurityConfig:
     inlet_mean: float
     inlet_std: float
@@ -62,9 +145,16 @@ class PurityConfig:
     outlet_noise_std: float
     outlet_noise_min: float
     outlet_noise_max: float
+    # Outlet purity bounds: [0, 100] intersected with the inlet range
+    clip_lo: float = field(init=False, repr=False, compare=False)
+    clip_hi: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.clip_lo = max(0.0, self.inlet_min)
+        self.clip_hi = min(100.0, self.inlet_max)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationConfig:
     pressure_margin_mpa: float
     temperature_min_c: float
@@ -84,11 +174,16 @@ class ValidationConfig:
 
 def build_thermo_config(cfg: Dict[str, Any]) -> ThermoConfig:
     thermo = cfg["thermodynamics"]
-    segments = thermo["compressibility_Z"]["segments"]
+    z_cfg = thermo["compressibility_Z"]
+    model = z_cfg.get("model", "piecewise_constant")
+    if model not in ("piecewise_constant", "linear"):
+        raise ValueError(f"Unsupported compressibility_Z model: {model!r}")
     return ThermoConfig(
         gas_constant_R_J_per_molK=thermo["gas_constant_R_J_per_molK"],
         molar_mass_H2_kg_per_mol=thermo["molar_mass_H2_kg_per_mol"],
-        compressibility_segments=segments,
+        compressibility_segments=z_cfg.get("segments", []),
+        compressibility_model=model,
+        z_linear_a=z_cfg.get("linear_a_per_pa", 5.865e-9),
     )
 
 
@@ -151,18 +246,53 @@ def build_validation_config(cfg: Dict[str, Any]) -> ValidationConfig:
 # -------------------------------------------------------------------
 
 
+# Maximum fixed-point iterations for P(mass) with piecewise-constant Z.
+# The iterates only take the values Z_i * n * R * T / V, so the loop
+# either reaches a repeated Z (an exact fixed point) or alternates
+# between neighbouring segments near a boundary; extrapolating schemes
+# such as Aitken's delta-squared would land between those values.
+PRESSURE_FIXED_POINT_MAX_ITER = 5
+
+# Upper bound on Z for the "linear" model, reached at P = 1 / a where
+# the linear term equals the ideal-gas term. Without it P(mass) would
+# have a pole at a * n * R * T / V = 1.
+LINEAR_Z_MAX = 2.0
+
+# Grid of the direct-indexed Z lookup table built by ThermoConfig;
+# pressures outside [0, Z_LUT_PMAX_MPA) use the binary search
+Z_LUT_RESOLUTION_PER_MPA = 10
+Z_LUT_PMAX_MPA = 200.0
+
+
 def get_compressibility_z(pressure_mpa: float, thermo: ThermoConfig) -> float:
     """
     Approximate compressibility factor Z for hydrogen, given pressure
     in MPa, using piecewise-constant segments defined in config.
+
+    Segments may not overlap (ThermoConfig rejects overlapping ones).
+    The segment of the previous call is tried first, then the lookup
+    table, then a binary search on the sorted lower bounds. With the
+    "linear" model, Z = 1 + a * P (capped at LINEAR_Z_MAX) instead.
     """
-    for seg in thermo.compressibility_segments:
-        pmin = seg["pressure_min_mpa"]
-        pmax = seg["pressure_max_mpa"]
-        if pmin <= pressure_mpa < pmax:
-            return float(seg["Z"])
+    if thermo.compressibility_model == "linear":
+        Z = 1.0 + thermo.z_linear_a * pressure_mpa * 1.0e6
+        return LINEAR_Z_MAX if Z > LINEAR_Z_MAX else Z
+    pmin, pmax, Z = thermo._last_seg
+    if pmin <= pressure_mpa < pmax:
+        return Z
+    if 0.0 <= pressure_mpa < Z_LUT_PMAX_MPA:
+        idx = thermo._seg_lut[int(pressure_mpa * Z_LUT_RESOLUTION_PER_MPA)]
+        if idx == -1:
+            return thermo.Z_fallback
+    else:
+        idx = -2
+    if idx == -2:
+        idx = bisect_right(thermo._pmin, pressure_mpa) - 1
+    if idx >= 0 and pressure_mpa < thermo._pmax[idx]:
+        thermo._last_seg = (thermo._pmin[idx], thermo._pmax[idx], thermo._Z[idx])
+        return thermo._Z[idx]
     # Fallback to last segment if outside range
-    return float(thermo.compressibility_segments[-1]["Z"])
+    return thermo.Z_fallback
 
 
 def compute_temperature_c(
@@ -171,23 +301,27 @@ def compute_temperature_c(
     gradient_c_per_km: float,
     noise_cfg: TemperatureNoiseConfig,
     rng: np.random.Generator,
-) -> float:
+    size: Optional[int] = None,
+) -> Union[float, np.ndarray]:
     """
     Compute temperature at depth using a simple geothermal gradient:
 
         T = base_temperature_c + gradient_c_per_km * depth_km + noise
 
-    Depth is in meters, gradient in °C per km.
+    Depth is in meters, gradient in °C per km. If ``size`` is given,
+    ``size`` noise draws are made at once and an array is returned.
     """
     depth_km = depth_m / 1000.0
     temperature = base_temperature_c + gradient_c_per_km * depth_km
 
     if noise_cfg.distribution == "normal":
-        noise = rng.normal(noise_cfg.mean, noise_cfg.std)
+        noise = rng.normal(noise_cfg.mean, noise_cfg.std, size=size)
     else:
-        noise = 0.0
+        noise = 0.0 if size is None else np.zeros(size)
 
-    return float(temperature + noise)
+    if size is None:
+        return float(temperature + noise)
+    return temperature + noise
 
 
 def mass_from_pvt(
@@ -219,13 +353,13 @@ def mass_from_pvt(
     temperature_k = temperature_c + 273.15
 
     Z = get_compressibility_z(pressure_mpa, thermo)
-    R = thermo.gas_constant_R_J_per_molK
-    M = thermo.molar_mass_H2_kg_per_mol
 
-    n_moles = (pressure_pa * volume_m3) / (Z * R * temperature_k)
-    mass_kg = n_moles * M
+    # n * M = P * V * (M / R) / (Z * T)
+    mass_kg = float((pressure_pa * volume_m3 * thermo.M_over_R) / (Z * temperature_k))
 
-    return max(float(mass_kg), 0.0)
+    # Inline clamps below are max(x, 0.0) without the builtin call,
+    # NaN passing through unchanged
+    return 0.0 if mass_kg < 0.0 else mass_kg
 
 
 def pressure_from_mass(
@@ -238,26 +372,210 @@ def pressure_from_mass(
     Invert the real-gas relationship to compute P [MPa] from mass [kg],
     T [°C], and volume [m3].
 
-    We solve P using a simple fixed-point iteration for Z(P).
+    We solve P using a simple fixed-point iteration for Z(P), starting
+    from the ideal-gas pressure; for increasing Z(P) it converges to the
+    lowest self-consistent pressure. With the "linear" Z model,
+    P = C * (1 + a * P) where C = n * R * T / V has the closed-form
+    solution P = C / (1 - a * C); for a * C >= 1 - 1 / LINEAR_Z_MAX,
+    where Z would exceed its cap, P = LINEAR_Z_MAX * C instead.
     """
     if volume_m3 <= 0 or mass_kg <= 0:
         return 0.0
 
     temperature_k = temperature_c + 273.15
-    R = thermo.gas_constant_R_J_per_molK
-    M = thermo.molar_mass_H2_kg_per_mol
 
-    n_moles = mass_kg / M
+    # Ideal-gas pressure n * R * T / V, with n = mass / M; the real-gas
+    # pressure is Z(P) times this
+    ideal_pa = (
+        mass_kg * thermo.R_over_M * temperature_k
+        / (1e-9 if volume_m3 < 1e-9 else volume_m3)
+    )
 
-    # Initial guess and fixed-point iterations
-    pressure_pa = 1.0e7  # ~10 MPa
-    for _ in range(5):
+    if thermo.compressibility_model == "linear":
+        denom = 1.0 - thermo.z_linear_a * ideal_pa
+        denom_min = 1.0 / LINEAR_Z_MAX
+        pressure_mpa = float(ideal_pa / (denom_min if denom < denom_min else denom)) / 1.0e6
+        return 0.0 if pressure_mpa < 0.0 else pressure_mpa
+
+    # Fixed-point iterations P = Z(P) * ideal_pa, starting from the
+    # ideal-gas pressure. Within a segment Z is constant, so this is
+    # also the Newton step for P - Z(P) * ideal_pa = 0 and is exact once
+    # the segment stops changing; P depends on the previous iterate only
+    # through Z, so the loop stops as soon as Z repeats.
+    pressure_pa = ideal_pa
+    Z_prev = math.nan
+    for _ in range(PRESSURE_FIXED_POINT_MAX_ITER):
         pressure_mpa = pressure_pa / 1.0e6
         Z = get_compressibility_z(pressure_mpa, thermo)
-        pressure_pa = (Z * n_moles * R * temperature_k) / max(volume_m3, 1e-9)
+        if Z == Z_prev:
+            break
+        Z_prev = Z
+        pressure_pa = Z * ideal_pa
+
+    pressure_mpa_final = float(pressure_pa / 1.0e6)
+    return 0.0 if pressure_mpa_final < 0.0 else pressure_mpa_final
+
+
+def _linear_z_pressure_pa(
+    ideal_pa: Union[float, np.ndarray],
+    a: float,
+) -> Union[float, np.ndarray]:
+    """
+    Solve P = C * (1 + a * P) for P, given ideal-gas pressures C [Pa],
+    with Z = P / C capped at LINEAR_Z_MAX (see pressure_from_mass).
+    """
+    return ideal_pa / np.maximum(1.0 - a * ideal_pa, 1.0 / LINEAR_Z_MAX)
+
+
+def get_compressibility_z_vec(
+    pressure_mpa: np.ndarray,
+    thermo: ThermoConfig,
+) -> np.ndarray:
+    """
+    Array version of get_compressibility_z: same segments, same lookup
+    table and same fallback to the last segment. Elements the table
+    does not resolve go through the binary search.
+    """
+    pressure_mpa = np.asarray(pressure_mpa, dtype=float)
+    if thermo.compressibility_model == "linear":
+        return np.minimum(1.0 + thermo.z_linear_a * pressure_mpa * 1.0e6, LINEAR_Z_MAX)
+
+    flat = pressure_mpa.ravel()
+    in_lut = (flat >= 0.0) & (flat < Z_LUT_PMAX_MPA)
+    k = np.where(in_lut, flat * Z_LUT_RESOLUTION_PER_MPA, 0.0).astype(np.intp)
+    Z = thermo.Z_lut[k]
+    miss = ~in_lut | np.isnan(Z)
+    if miss.any():
+        Z[miss] = _search_compressibility_z_vec(flat[miss], thermo)
+    return Z.reshape(pressure_mpa.shape)
+
+
+def _search_compressibility_z_vec(
+    pressure_mpa: np.ndarray,
+    thermo: ThermoConfig,
+) -> np.ndarray:
+    """Binary-search segment lookup behind get_compressibility_z_vec."""
+    if not thermo._pmin:
+        return np.full(pressure_mpa.shape, thermo.Z_fallback)
+    idx = np.searchsorted(thermo.pmin_arr, pressure_mpa, side="right") - 1
+    safe_idx = np.maximum(idx, 0)
+    in_seg = (idx >= 0) & (pressure_mpa < thermo.pmax_arr[safe_idx])
+    return np.where(in_seg, thermo.Z_arr[safe_idx], thermo.Z_fallback)
+
+
+def compute_temperature_c_vec(
+    depth_m: np.ndarray,
+    base_temperature_c: Union[float, np.ndarray],
+    gradient_c_per_km: Union[float, np.ndarray],
+    noise_cfg: TemperatureNoiseConfig,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Array version of compute_temperature_c: one temperature per element
+    of depth [m], with one noise draw per element made in a single call.
+    Base temperature and gradient may be scalars or arrays (e.g. one
+    value per facility type).
+    """
+    temperature = base_temperature_c + gradient_c_per_km * (
+        np.asarray(depth_m, dtype=float) / 1000.0
+    )
+    if noise_cfg.distribution == "normal":
+        temperature = temperature + rng.normal(
+            noise_cfg.mean, noise_cfg.std, size=temperature.shape
+        )
+    return temperature
+
+
+def mass_from_pvt_vec(
+    pressure_mpa: np.ndarray,
+    temperature_c: np.ndarray,
+    volume_m3: Union[float, np.ndarray],
+    thermo: ThermoConfig,
+    dtype: Any = np.float64,
+) -> np.ndarray:
+    """
+    Array version of mass_from_pvt: hydrogen mass [kg] for each element
+    of P [MPa], T [°C] and volume [m3], broadcast together. Elements
+    with non-positive volume get zero mass.
+
+    Inputs, constants and the result use ``dtype``; float32 halves the
+    memory traffic for large arrays at ~1e-7 relative precision.
+    """
+    dtype = np.dtype(dtype)
+    pressure_mpa = np.asarray(pressure_mpa, dtype=dtype)
+    temperature_c = np.asarray(temperature_c, dtype=dtype)
+    volume_m3 = np.asarray(volume_m3, dtype=dtype)
+    shape = np.broadcast_shapes(
+        pressure_mpa.shape, temperature_c.shape, volume_m3.shape
+    )
+
+    Z = get_compressibility_z_vec(pressure_mpa, thermo).astype(dtype, copy=False)
+
+    # (P*1e6*V*M/R) / (Z*(T+273.15)) evaluated into two buffers, in the
+    # same operation order as mass_from_pvt
+    mass_kg = np.empty(shape, dtype=dtype)
+    np.multiply(pressure_mpa, dtype.type(1.0e6), out=mass_kg)
+    mass_kg *= volume_m3
+    mass_kg *= dtype.type(thermo.M_over_R)
+    denom = np.empty(shape, dtype=dtype)
+    np.add(temperature_c, dtype.type(273.15), out=denom)
+    denom *= Z
+    mass_kg /= denom
 
-    pressure_mpa_final = pressure_pa / 1.0e6
-    return max(float(pressure_mpa_final), 0.0)
+    np.copyto(mass_kg, dtype.type(0.0), where=~(volume_m3 > 0))
+    return np.maximum(mass_kg, dtype.type(0.0), out=mass_kg)
+
+
+def pressure_from_mass_vec(
+    mass_kg: np.ndarray,
+    temperature_c: np.ndarray,
+    volume_m3: float,
+    thermo: ThermoConfig,
+    dtype: Any = np.float64,
+) -> np.ndarray:
+    """
+    Array version of pressure_from_mass: P [MPa] for each element of
+    mass [kg] and T [°C], using the same fixed-point iteration
+    for Z(P) (or the linear-Z closed form) applied to the whole array.
+
+    Inputs, constants and the result use ``dtype`` (see mass_from_pvt_vec).
+    """
+    dtype = np.dtype(dtype)
+    mass_kg = np.asarray(mass_kg, dtype=dtype)
+    temperature_c = np.asarray(temperature_c, dtype=dtype)
+    if volume_m3 <= 0:
+        return np.zeros(np.broadcast(mass_kg, temperature_c).shape, dtype=dtype)
+
+    # mass*R/M*(T+273.15)/V evaluated into one buffer
+    ideal_pa = np.empty(np.broadcast_shapes(mass_kg.shape, temperature_c.shape), dtype=dtype)
+    np.multiply(mass_kg, dtype.type(thermo.R_over_M), out=ideal_pa)
+    ideal_pa *= temperature_c + dtype.type(273.15)
+    ideal_pa /= dtype.type(max(volume_m3, 1e-9))
+
+    if thermo.compressibility_model == "linear":
+        pressure_mpa = _linear_z_pressure_pa(
+            ideal_pa, dtype.type(thermo.z_linear_a)
+        ) / dtype.type(1.0e6)
+        return np.maximum(pressure_mpa, dtype.type(0.0), out=pressure_mpa)
+
+    # The iterate and its MPa view live in two reused buffers
+    pressure_pa = np.empty_like(ideal_pa)
+    pressure_mpa = np.empty_like(ideal_pa)
+    np.copyto(pressure_pa, ideal_pa)
+    Z_prev = None
+    for _ in range(PRESSURE_FIXED_POINT_MAX_ITER):
+        np.divide(pressure_pa, dtype.type(1.0e6), out=pressure_mpa)
+        Z = get_compressibility_z_vec(pressure_mpa, thermo).astype(dtype, copy=False)
+        # Same early exit as the scalar version, once no element changes Z
+        if Z_prev is not None and np.array_equal(Z, Z_prev):
+            break
+        Z_prev = Z
+        np.multiply(Z, ideal_pa, out=pressure_pa)
+
+    # Non-positive mass gives non-positive pressure, so one clamp covers
+    # the scalar version's early return
+    np.divide(pressure_pa, dtype.type(1.0e6), out=pressure_mpa)
+    return np.maximum(pressure_mpa, dtype.type(0.0), out=pressure_mpa)
 
 
 # -------------------------------------------------------------------
@@ -265,6 +583,10 @@ def pressure_from_mass(
 # -------------------------------------------------------------------
 
 
+# cP -> Pa.s, mD -> m2 and Pa -> MPa folded into one factor
+_DARCY_CONST_MPA = 1.0e-3 / 9.869e-16 / 1.0e6
+
+
 def approximate_darcy_pressure_change_mpa(
     rate_m3_per_s: float,
     viscosity_cp: float,
@@ -288,12 +610,38 @@ def approximate_darcy_pressure_change_mpa(
     if rate_m3_per_s <= 0 or area_m2 <= 0 or permeability_mD <= 0:
         return 0.0
 
-    mu_pa_s = viscosity_cp * 1.0e-3
-    k_m2 = permeability_mD * 9.869e-16
+    delta_p_mpa = (
+        _DARCY_CONST_MPA * (rate_m3_per_s * viscosity_cp * length_m)
+        / (permeability_mD * area_m2)
+    )
+    delta_p_mpa = float(delta_p_mpa)
+    return 0.0 if delta_p_mpa < 0.0 else delta_p_mpa
 
-    delta_p_pa = (rate_m3_per_s * mu_pa_s * length_m) / (k_m2 * area_m2)
-    delta_p_mpa = delta_p_pa / 1.0e6
-    return max(float(delta_p_mpa), 0.0)
+
+def approximate_darcy_pressure_change_mpa_vec(
+    rate_m3_per_s: np.ndarray,
+    viscosity_cp: Union[float, np.ndarray],
+    length_m: Union[float, np.ndarray],
+    permeability_mD: Union[float, np.ndarray],
+    area_m2: Union[float, np.ndarray],
+) -> np.ndarray:
+    """
+    Array version of approximate_darcy_pressure_change_mpa, broadcasting
+    all inputs. Elements with non-positive rate, area or permeability
+    get zero.
+    """
+    rate_m3_per_s = np.asarray(rate_m3_per_s, dtype=float)
+    permeability_mD = np.asarray(permeability_mD, dtype=float)
+    area_m2 = np.asarray(area_m2, dtype=float)
+
+    valid = (rate_m3_per_s > 0) & (area_m2 > 0) & (permeability_mD > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        delta_p_mpa = (
+            _DARCY_CONST_MPA * (rate_m3_per_s * viscosity_cp * length_m)
+            / (permeability_mD * area_m2)
+        )
+    delta_p_mpa = np.where(valid, delta_p_mpa, 0.0)
+    return np.maximum(delta_p_mpa, 0.0, out=delta_p_mpa)
 
 
 # -------------------------------------------------------------------
@@ -301,11 +649,18 @@ def approximate_darcy_pressure_change_mpa(
 # -------------------------------------------------------------------
 
 
-def sample_loss_fraction(loss_cfg: LossConfig, rng: np.random.Generator) -> float:
+def sample_loss_fraction(
+    loss_cfg: LossConfig,
+    rng: np.random.Generator,
+    size: Optional[int] = None,
+) -> Union[float, np.ndarray]:
     """
     Sample a dimensionless loss fraction from configured bounds.
+    Returns an array of ``size`` draws if ``size`` is given.
     """
-    return float(rng.uniform(loss_cfg.loss_min, loss_cfg.loss_max))
+    if size is None:
+        return float(rng.uniform(loss_cfg.loss_min, loss_cfg.loss_max))
+    return rng.uniform(loss_cfg.loss_min, loss_cfg.loss_max, size=size)
 
 
 def compute_cycle_losses_kg(
@@ -317,29 +672,47 @@ def compute_cycle_losses_kg(
     """
     if working_gas_kg <= 0 or loss_fraction <= 0:
         return 0.0
-    return max(float(working_gas_kg * loss_fraction), 0.0)
+    losses_kg = float(working_gas_kg * loss_fraction)
+    return 0.0 if losses_kg < 0.0 else losses_kg
 
 
-def sample_inlet_purity_pct(purity_cfg: PurityConfig, rng: np.random.Generator) -> float:
+def sample_inlet_purity_pct(
+    purity_cfg: PurityConfig,
+    rng: np.random.Generator,
+    size: Optional[int] = None,
+) -> Union[float, np.ndarray]:
     """
     Sample inlet hydrogen purity [%] from a normal distribution and
-    clip to [inlet_min, inlet_max].
+    clip to [inlet_min, inlet_max]. Returns an array of ``size`` draws
+    if ``size`` is given.
     """
-    val = rng.normal(purity_cfg.inlet_mean, purity_cfg.inlet_std)
-    val = max(purity_cfg.inlet_min, val)
-    val = min(purity_cfg.inlet_max, val)
-    return float(val)
+    val = rng.normal(purity_cfg.inlet_mean, purity_cfg.inlet_std, size=size)
+    if size is not None:
+        return np.clip(val, purity_cfg.inlet_min, purity_cfg.inlet_max, out=val)
+    return float(min(purity_cfg.inlet_max, max(purity_cfg.inlet_min, val)))
 
 
 def update_purity_out_pct(
-    purity_in_pct: float,
+    purity_in_pct: Union[float, np.ndarray],
     purity_cfg: PurityConfig,
     rng: np.random.Generator,
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Compute outlet purity [%] from inlet purity and a small noise term.
     This allows minor drift in purity between inlet and outlet.
+
+    If ``purity_in_pct`` is an array, one noise term is drawn per
+    element and an array is returned.
     """
+    if isinstance(purity_in_pct, np.ndarray):
+        noise = rng.normal(
+            purity_cfg.outlet_noise_mean,
+            purity_cfg.outlet_noise_std,
+            size=purity_in_pct.shape,
+        )
+        noise += purity_in_pct
+        return np.clip(noise, purity_cfg.clip_lo, purity_cfg.clip_hi, out=noise)
+
     noise = rng.normal(
         purity_cfg.outlet_noise_mean,
         purity_cfg.outlet_noise_std,
@@ -347,12 +720,7 @@ def update_purity_out_pct(
     purity_out = purity_in_pct + noise
 
     # Clip outlet purity to a safe range (0–100) and within config inlet bounds
-    purity_out = max(0.0, purity_out)
-    purity_out = min(100.0, purity_out)
-    purity_out = max(purity_cfg.inlet_min, purity_out)
-    purity_out = min(purity_cfg.inlet_max, purity_out)
-
-    return float(purity_out)
+    return float(min(purity_cfg.clip_hi, max(purity_cfg.clip_lo, purity_out)))
 
 
 # -------------------------------------------------------------------
@@ -379,6 +747,18 @@ def mass_balance_residual_fraction(
     return float(numerator / denom)
 
 
+def make_pressure_bounds(
+    p_min_mpa: Union[float, np.ndarray],
+    p_max_mpa: Union[float, np.ndarray],
+    margin_mpa: float,
+) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+    """
+    Accepted pressure interval [p_min - margin, p_max + margin]; compute
+    it once per facility (or per array of facilities) and reuse it.
+    """
+    return p_min_mpa - margin_mpa, p_max_mpa + margin_mpa
+
+
 def check_pressure_within_bounds(
     pressure_mpa: float,
     p_min_mpa: float,
@@ -388,9 +768,8 @@ def check_pressure_within_bounds(
     """
     True if pressure is within [p_min - margin, p_max + margin].
     """
-    lower = p_min_mpa - margin_mpa
-    upper = p_max_mpa + margin_mpa
-    return (pressure_mpa >= lower) and (pressure_mpa <= upper)
+    lower, upper = make_pressure_bounds(p_min_mpa, p_max_mpa, margin_mpa)
+    return lower <= pressure_mpa <= upper
 
 
 def check_temperature_range(
@@ -424,7 +803,105 @@ def is_mass_balance_ok(
     """
     Return True if mass-balance residual is within configured tolerance.
     """
+    # Idle timesteps have a zero residual; skip computing it
+    if (
+        injected_kg == 0.0
+        and withdrawn_kg == 0.0
+        and losses_kg == 0.0
+        and delta_storage_kg == 0.0
+    ):
+        return True
     residual = mass_balance_residual_fraction(
         injected_kg, withdrawn_kg, losses_kg, delta_storage_kg
     )
     return residual <= vcfg.mass_balance_tolerance_fraction
+
+
+def mass_balance_residual_fraction_vec(
+    injected_kg: np.ndarray,
+    withdrawn_kg: np.ndarray,
+    losses_kg: np.ndarray,
+    delta_storage_kg: np.ndarray,
+) -> np.ndarray:
+    """
+    Array version of mass_balance_residual_fraction, element-wise over
+    broadcast inputs (e.g. whole timeseries columns).
+    """
+    eps = 1e-9
+    injected_kg = np.asarray(injected_kg, dtype=float)
+    numerator = np.abs(injected_kg - withdrawn_kg - losses_kg - delta_storage_kg)
+    denom = np.maximum(np.abs(injected_kg), eps)
+    return numerator / denom
+
+
+def check_pressure_within_bounds_vec(
+    pressure_mpa: np.ndarray,
+    p_min_mpa: Union[float, np.ndarray],
+    p_max_mpa: Union[float, np.ndarray],
+    margin_mpa: float,
+) -> np.ndarray:
+    """
+    Array version of check_pressure_within_bounds; bounds may be
+    scalars or per-element arrays.
+    """
+    lower, upper = make_pressure_bounds(
+        np.asarray(p_min_mpa), np.asarray(p_max_mpa), margin_mpa
+    )
+    return pressure_in_bounds_vec(pressure_mpa, lower, upper)
+
+
+def pressure_in_bounds_vec(
+    pressure_mpa: np.ndarray,
+    lower_mpa: Union[float, np.ndarray],
+    upper_mpa: Union[float, np.ndarray],
+) -> np.ndarray:
+    """
+    Mask of pressures within [lower, upper], for bounds precomputed
+    with make_pressure_bounds.
+    """
+    pressure_mpa = np.asarray(pressure_mpa)
+    return (pressure_mpa >= lower_mpa) & (pressure_mpa <= upper_mpa)
+
+
+def check_temperature_range_vec(
+    temperature_c: np.ndarray,
+    vcfg: ValidationConfig,
+) -> np.ndarray:
+    temperature_c = np.asarray(temperature_c)
+    return (temperature_c >= vcfg.temperature_min_c) & (
+        temperature_c <= vcfg.temperature_max_c
+    )
+
+
+def check_purity_range_vec(
+    purity_pct: np.ndarray,
+    vcfg: ValidationConfig,
+) -> np.ndarray:
+    purity_pct = np.asarray(purity_pct)
+    return (purity_pct >= vcfg.purity_min_pct) & (purity_pct <= vcfg.purity_max_pct)
+
+
+def check_loss_fraction_range_vec(
+    loss_fraction: np.ndarray,
+    vcfg: ValidationConfig,
+) -> np.ndarray:
+    loss_fraction = np.asarray(loss_fraction)
+    return (loss_fraction >= vcfg.loss_fraction_min) & (
+        loss_fraction <= vcfg.loss_fraction_max
+    )
+
+
+def is_mass_balance_ok_vec(
+    injected_kg: np.ndarray,
+    withdrawn_kg: np.ndarray,
+    losses_kg: np.ndarray,
+    delta_storage_kg: np.ndarray,
+    vcfg: ValidationConfig,
+) -> np.ndarray:
+    """
+    Array version of is_mass_balance_ok.
+    """
+    residual = mass_balance_residual_fraction_vec(
+        injected_kg, withdrawn_kg, losses_kg, delta_storage_kg
+    )
+    return residual <= vcfg.mass_balance_tolerance_fraction
@@ -0,0 +1,260 @@
+"""
+physics_numba.py
+----------------------------------------------------------------------
+Compiled PVT helpers for the SUHS-MRV synthetic dataset.
+
+These mirror mass_from_pvt, pressure_from_mass and
+get_compressibility_z in physics.py for stateful loops that cannot be
+batched into NumPy arrays. They are meant to be called from other
+numba kernels: unpack the ThermoConfig once with thermo_arrays() and
+pass the result along, e.g.
+
+    args = thermo_arrays(thermo)
+    pressure_from_mass_nb(mass_kg, temperature_c, volume_m3, *args)
+
+Called one at a time from Python, the dispatch overhead outweighs the
+compiled speedup; use the *_vec functions in physics.py there instead.
+For large arrays, mass_from_pvt_batch and pressure_from_mass_batch
+run the scalar kernels element-wise across all cores; on a single core
+the *_vec functions are faster.
+
+Results match the pure-Python versions exactly. numba is optional;
+without it the same functions run as plain Python.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from _numba_compat import njit, prange
+from physics import LINEAR_Z_MAX, PRESSURE_FIXED_POINT_MAX_ITER, ThermoConfig
+
+
+# -------------------------------------------------------------------
+# CONFIG UNPACKING
+# -------------------------------------------------------------------
+
+
+def thermo_arrays(
+    thermo: ThermoConfig,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float, bool, float, float, float]:
+    """
+    Unpack a ThermoConfig into the positional arguments taken by the
+    compiled functions below, after the pressure/mass/T/V inputs:
+
+      pmin_arr, pmax_arr, Z_arr, Z_fallback, linear, z_linear_a,
+      M_over_R, R_over_M
+    """
+    return (
+        thermo.pmin_arr,
+        thermo.pmax_arr,
+        thermo.Z_arr,
+        thermo.Z_fallback,
+        thermo.compressibility_model == "linear",
+        thermo.z_linear_a,
+        thermo.M_over_R,
+        thermo.R_over_M,
+    )
+
+
+# -------------------------------------------------------------------
+# COMPILED KERNELS
+# -------------------------------------------------------------------
+
+
+@njit(cache=True)
+def compressibility_z_nb(
+    pressure_mpa, pmin_arr, pmax_arr, Z_arr, z_fallback, linear, z_linear_a
+):
+    """Compiled counterpart of physics.get_compressibility_z."""
+    if linear:
+        Z = 1.0 + z_linear_a * pressure_mpa * 1.0e6
+        return LINEAR_Z_MAX if Z > LINEAR_Z_MAX else Z
+    idx = np.searchsorted(pmin_arr, pressure_mpa, side="right") - 1
+    if idx >= 0 and pressure_mpa < pmax_arr[idx]:
+        return Z_arr[idx]
+    return z_fallback
+
+
+@njit(cache=True)
+def mass_from_pvt_nb(
+    pressure_mpa,
+    temperature_c,
+    volume_m3,
+    pmin_arr,
+    pmax_arr,
+    Z_arr,
+    z_fallback,
+    linear,
+    z_linear_a,
+    M_over_R,
+    R_over_M,
+):
+    """Compiled counterpart of physics.mass_from_pvt."""
+    if volume_m3 <= 0:
+        return 0.0
+
+    pressure_pa = pressure_mpa * 1.0e6
+    temperature_k = temperature_c + 273.15
+
+    Z = compressibility_z_nb(
+        pressure_mpa, pmin_arr, pmax_arr, Z_arr, z_fallback, linear, z_linear_a
+    )
+    mass_kg = (pressure_pa * volume_m3 * M_over_R) / (Z * temperature_k)
+
+    return max(mass_kg, 0.0)
+
+
+@njit(cache=True)
+def pressure_from_mass_nb(
+    mass_kg,
+    temperature_c,
+    volume_m3,
+    pmin_arr,
+    pmax_arr,
+    Z_arr,
+    z_fallback,
+    linear,
+    z_linear_a,
+    M_over_R,
+    R_over_M,
+):
+    """Compiled counterpart of physics.pressure_from_mass."""
+    if volume_m3 <= 0 or mass_kg <= 0:
+        return 0.0
+
+    temperature_k = temperature_c + 273.15
+    ideal_pa = mass_kg * R_over_M * temperature_k / max(volume_m3, 1e-9)
+
+    if linear:
+        denom = 1.0 - z_linear_a * ideal_pa
+        denom_min = 1.0 / LINEAR_Z_MAX
+        return max((ideal_pa / (denom_min if denom < denom_min else denom)) / 1.0e6, 0.0)
+
+    # Fixed-point iterations from the ideal-gas pressure, stopping once
+    # Z repeats
+    pressure_pa = ideal_pa
+    Z_prev = np.nan
+    for _ in range(PRESSURE_FIXED_POINT_MAX_ITER):
+        pressure_mpa = pressure_pa / 1.0e6
+        Z = compressibility_z_nb(
+            pressure_mpa, pmin_arr, pmax_arr, Z_arr, z_fallback, linear, z_linear_a
+        )
+        if Z == Z_prev:
+            break
+        Z_prev = Z
+        pressure_pa = Z * ideal_pa
+
+    return max(pressure_pa / 1.0e6, 0.0)
+
+
+# -------------------------------------------------------------------
+# PARALLEL BATCH KERNELS
+# -------------------------------------------------------------------
+
+
+@njit(parallel=True, cache=True)
+def mass_from_pvt_batch_nb(
+    pressure_mpa,
+    temperature_c,
+    volume_m3,
+    pmin_arr,
+    pmax_arr,
+    Z_arr,
+    z_fallback,
+    linear,
+    z_linear_a,
+    M_over_R,
+    R_over_M,
+    out,
+):
+    """mass_from_pvt_nb over equal-length 1-D arrays, written into ``out``."""
+    for i in prange(pressure_mpa.shape[0]):
+        out[i] = mass_from_pvt_nb(
+            pressure_mpa[i],
+            temperature_c[i],
+            volume_m3[i],
+            pmin_arr,
+            pmax_arr,
+            Z_arr,
+            z_fallback,
+            linear,
+            z_linear_a,
+            M_over_R,
+            R_over_M,
+        )
+    return out
+
+
+@njit(parallel=True, cache=True)
+def pressure_from_mass_batch_nb(
+    mass_kg,
+    temperature_c,
+    volume_m3,
+    pmin_arr,
+    pmax_arr,
+    Z_arr,
+    z_fallback,
+    linear,
+    z_linear_a,
+    M_over_R,
+    R_over_M,
+    out,
+):
+    """pressure_from_mass_nb over equal-length 1-D arrays, written into ``out``."""
+    for i in prange(mass_kg.shape[0]):
+        out[i] = pressure_from_mass_nb(
+            mass_kg[i],
+            temperature_c[i],
+            volume_m3[i],
+            pmin_arr,
+            pmax_arr,
+            Z_arr,
+            z_fallback,
+            linear,
+            z_linear_a,
+            M_over_R,
+            R_over_M,
+        )
+    return out
+
+
+def _batch_inputs(*arrays: np.ndarray) -> Tuple[Tuple[np.ndarray, ...], Tuple[int, ...]]:
+    """Broadcast inputs together and flatten them to contiguous float64."""
+    arrays = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in arrays))
+    shape = arrays[0].shape
+    return tuple(np.ascontiguousarray(a).ravel() for a in arrays), shape
+
+
+def mass_from_pvt_batch(
+    pressure_mpa: np.ndarray,
+    temperature_c: np.ndarray,
+    volume_m3: np.ndarray,
+    thermo: ThermoConfig,
+) -> np.ndarray:
+    """
+    Parallel counterpart of physics.mass_from_pvt_vec, with the same
+    broadcasting and identical results.
+    """
+    (p, t, v), shape = _batch_inputs(pressure_mpa, temperature_c, volume_m3)
+    out = np.empty(p.shape[0])
+    mass_from_pvt_batch_nb(p, t, v, *thermo_arrays(thermo), out)
+    return out.reshape(shape)
+
+
+def pressure_from_mass_batch(
+    mass_kg: np.ndarray,
+    temperature_c: np.ndarray,
+    volume_m3: np.ndarray,
+    thermo: ThermoConfig,
+) -> np.ndarray:
+    """
+    Parallel counterpart of physics.pressure_from_mass for arrays; the
+    volume may vary per element.
+    """
+    (m, t, v), shape = _batch_inputs(mass_kg, temperature_c, volume_m3)
+    out = np.empty(m.shape[0])
+    pressure_from_mass_batch_nb(m, t, v, *thermo_arrays(thermo), out)
+    return out.reshape(shape)
@@ -0,0 +1,10 @@
+"""
+conftest.py
+----------------------------------------------------------------------
+Make the modules under src/ importable from the tests.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -0,0 +1,169 @@
+"""
+test_generator.py
+----------------------------------------------------------------------
+End-to-end checks for generate_uhs_dataset on a small configuration.
+"""
+
+import copy
+import os
+
+import pandas as pd
+import pytest
+import yaml
+
+import generator as g
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "..", "config", "uhs_config.yaml")
+
+
+@pytest.fixture
+def write_config(tmp_path):
+    """Write a small variant of the shipped config; returns its path."""
+    base = g.load_config(CONFIG_PATH)
+
+    def _write(name="small.yaml", random_seed=42):
+        cfg = copy.deepcopy(base)
+        cfg["global"]["random_seed"] = random_seed
+        cfg["global"]["n_facilities"] = 4
+        cfg["global"]["simulation"]["n_years"] = 1
+        path = tmp_path / name
+        path.write_text(yaml.safe_dump(cfg))
+        return str(path)
+
+    return _write
+
+
+def _assert_frames_equal(left, right):
+    for left_df, right_df in zip(left, right):
+        pd.testing.assert_frame_equal(left_df, right_df)
+
+
+# -------------------------------------------------------------------
+# PARALLEL SIMULATION
+# -------------------------------------------------------------------
+
+
+def test_n_jobs_does_not_change_results(write_config, tmp_path):
+    config_path = write_config()
+    serial = g.generate_uhs_dataset(
+        config_path, str(tmp_path / "serial"), n_jobs=1, use_cache=False
+    )
+    parallel = g.generate_uhs_dataset(
+        config_path, str(tmp_path / "parallel"), n_jobs=-1, use_cache=False
+    )
+    _assert_frames_equal(serial, parallel)
+
+
+# -------------------------------------------------------------------
+# OUTPUT OPTIONS
+# -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "options", [{"output_format": "CSV"}, {"csv_engine": "polars"}]
+)
+def test_invalid_output_options_fail_before_simulating(write_config, tmp_path, options):
+    output_dir = tmp_path / "out"
+    with pytest.raises(ValueError):
+        g.generate_uhs_dataset(write_config(), str(output_dir), **options)
+    assert not output_dir.exists()
+
+
+# -------------------------------------------------------------------
+# PARQUET CACHE
+# -------------------------------------------------------------------
+
+
+def _cache_entries(output_dir):
+    return sorted(os.listdir(os.path.join(output_dir, ".cache")))
+
+
+def test_cache_hit_matches_cold_run(write_config, tmp_path):
+    config_path = write_config()
+    output_dir = str(tmp_path / "out")
+    cold = g.generate_uhs_dataset(config_path, output_dir)
+    with open(os.path.join(output_dir, "facility_timeseries.csv")) as f:
+        cold_csv = f.read()
+
+    cached = g.generate_uhs_dataset(config_path, output_dir)
+    _assert_frames_equal(cold, cached)
+    for cold_df, cached_df in zip(cold, cached):
+        assert cold_df.dtypes.equals(cached_df.dtypes)
+    with open(os.path.join(output_dir, "facility_timeseries.csv")) as f:
+        assert f.read() == cold_csv
+
+
+def test_cache_hit_rewrites_outputs_of_other_config(write_config, tmp_path):
+    config_a = write_config("a.yaml", random_seed=1)
+    config_b = write_config("b.yaml", random_seed=2)
+    output_dir = str(tmp_path / "out")
+    timeseries_path = os.path.join(output_dir, "facility_timeseries.csv")
+
+    g.generate_uhs_dataset(config_a, output_dir)
+    with open(timeseries_path) as f:
+        csv_a = f.read()
+    g.generate_uhs_dataset(config_b, output_dir)
+    with open(timeseries_path) as f:
+        assert f.read() != csv_a
+
+    g.generate_uhs_dataset(config_a, output_dir)
+    with open(timeseries_path) as f:
+        assert f.read() == csv_a
+
+
+def test_corrupt_cache_entry_is_regenerated(write_config, tmp_path):
+    config_path = write_config()
+    output_dir = str(tmp_path / "out")
+    cold = g.generate_uhs_dataset(config_path, output_dir)
+
+    (entry,) = _cache_entries(output_dir)
+    with open(os.path.join(output_dir, ".cache", entry, "cycle_summary.parquet"), "wb") as f:
+        f.write(b"PAR1 truncated")
+
+    regenerated = g.generate_uhs_dataset(config_path, output_dir)
+    _assert_frames_equal(cold, regenerated)
+    assert g._load_cached_outputs(os.path.join(output_dir, ".cache", entry)) is not None
+
+
+def test_cache_keeps_most_recent_entries(write_config, tmp_path, monkeypatch):
+    monkeypatch.setattr(g, "_CACHE_MAX_ENTRIES", 2)
+    output_dir = str(tmp_path / "out")
+    configs = [write_config(f"c{seed}.yaml", random_seed=seed) for seed in range(3)]
+    entries = [
+        g._generation_cache_key(path, "dtype=float32") for path in configs
+    ]
+
+    g.generate_uhs_dataset(configs[0], output_dir)
+    g.generate_uhs_dataset(configs[1], output_dir)
+    # Make the first entry the older one, then use it again
+    for entry, mtime in zip(entries[:2], (100, 200)):
+        os.utime(os.path.join(output_dir, ".cache", entry), (mtime, mtime))
+    g.generate_uhs_dataset(configs[0], output_dir)
+    g.generate_uhs_dataset(configs[2], output_dir)
+
+    assert _cache_entries(output_dir) == sorted([entries[0], entries[2]])
+
+
+# -------------------------------------------------------------------
+# CSV WRITERS
+# -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "timestamps",
+    [
+        ["2030-01-01 12:00", "2030-01-08 12:00"],
+        ["2030-01-01 00:00:00", "2030-01-08 06:30:15"],
+        ["2030-01-01", "2030-01-08"],
+    ],
+)
+def test_pyarrow_csv_timestamps_match_pandas(tmp_path, timestamps):
+    pytest.importorskip("pyarrow")
+    frame = pd.DataFrame({"timestamp": pd.to_datetime(timestamps), "value": [1.5, 2.5]})
+    texts = []
+    for engine in ("pandas", "pyarrow"):
+        path = tmp_path / f"{engine}.csv"
+        g._write_frame(frame, str(path), csv_engine=engine)
+        texts.append([line.split(",")[0] for line in path.read_text().splitlines()])
+    assert texts[0] == texts[1]
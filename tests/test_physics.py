@@ -0,0 +1,212 @@
+"""
+test_physics.py
+----------------------------------------------------------------------
+Consistency checks for the PVT helpers in physics.py and
+physics_numba.py.
+
+The scalar, lookup-table, vectorized and compiled paths are expected
+to give bit-identical results; the float32 option of the vectorized
+kernels only needs to agree with float64 to single precision.
+"""
+
+import copy
+import os
+
+import numpy as np
+import pytest
+
+import physics as ph
+import physics_numba as pn
+from generator import load_config
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "..", "config", "uhs_config.yaml")
+
+# Boundaries off the lookup-table grid, plus an open-ended last segment
+OFF_GRID_SEGMENTS = (
+    (0.0, 7.05, 1.0),
+    (7.05, 12.375, 1.04),
+    (12.375, 199.95, 1.09),
+    (199.95, 250.0, 1.3),
+)
+
+
+def _reference_z(pressure_mpa, segments):
+    """First matching segment in config order, as in the original lookup."""
+    for pmin, pmax, Z in segments:
+        if pmin <= pressure_mpa < pmax:
+            return Z
+    return segments[-1][2]
+
+
+@pytest.fixture(scope="module")
+def cfg():
+    return load_config(CONFIG_PATH)
+
+
+@pytest.fixture(params=["config", "off_grid"])
+def piecewise_thermo(request, cfg):
+    thermo = ph.build_thermo_config(cfg)
+    if request.param == "off_grid":
+        thermo = ph.ThermoConfig(
+            thermo.gas_constant_R_J_per_molK,
+            thermo.molar_mass_H2_kg_per_mol,
+            OFF_GRID_SEGMENTS,
+        )
+    return thermo
+
+
+@pytest.fixture
+def linear_thermo(cfg):
+    cfg = copy.deepcopy(cfg)
+    cfg["thermodynamics"]["compressibility_Z"]["model"] = "linear"
+    return ph.build_thermo_config(cfg)
+
+
+def _pvt_samples(n=5000, seed=0):
+    rng = np.random.default_rng(seed)
+    return (
+        rng.uniform(-1.0, 260.0, n),  # pressure [MPa]
+        rng.uniform(10.0, 90.0, n),  # temperature [°C]
+        rng.uniform(-1.0e4, 1.0e6, n),  # volume [m3]
+        rng.uniform(-1.0e4, 6.0e7, n),  # mass [kg]
+    )
+
+
+def _boundary_pressures(thermo):
+    bounds = np.array(sorted(set(thermo._pmin + thermo._pmax)))
+    bounds = bounds[np.isfinite(bounds)]
+    return np.concatenate(
+        [bounds, np.nextafter(bounds, -np.inf), np.nextafter(bounds, np.inf)]
+    )
+
+
+# -------------------------------------------------------------------
+# COMPRESSIBILITY LOOKUP
+# -------------------------------------------------------------------
+
+
+def test_z_lookup_matches_config_order_scan(piecewise_thermo):
+    P = np.concatenate([_pvt_samples()[0], _boundary_pressures(piecewise_thermo)])
+    segments = piecewise_thermo.compressibility_segments
+
+    expected = np.array([_reference_z(p, segments) for p in P])
+    scalar = np.array([ph.get_compressibility_z(p, piecewise_thermo) for p in P])
+    args = pn.thermo_arrays(piecewise_thermo)[:6]
+    compiled = np.array([pn.compressibility_z_nb(p, *args) for p in P])
+
+    assert np.array_equal(scalar, expected)
+    assert np.array_equal(ph.get_compressibility_z_vec(P, piecewise_thermo), expected)
+    assert np.array_equal(compiled, expected)
+
+
+def test_overlapping_segments_are_rejected():
+    with pytest.raises(ValueError):
+        ph.ThermoConfig(8.314, 2.016e-3, ((0.0, 20.0, 1.0), (5.0, 15.0, 1.05)))
+
+
+# -------------------------------------------------------------------
+# PVT PATHS ARE BIT-IDENTICAL
+# -------------------------------------------------------------------
+
+
+def test_mass_from_pvt_paths_identical(piecewise_thermo, linear_thermo):
+    P, T, V, _ = _pvt_samples()
+    for thermo in (piecewise_thermo, linear_thermo):
+        args = pn.thermo_arrays(thermo)
+        scalar = np.array([ph.mass_from_pvt(p, t, v, thermo) for p, t, v in zip(P, T, V)])
+        compiled = np.array([pn.mass_from_pvt_nb(p, t, v, *args) for p, t, v in zip(P, T, V)])
+
+        assert np.array_equal(ph.mass_from_pvt_vec(P, T, V, thermo), scalar)
+        assert np.array_equal(compiled, scalar)
+        assert np.array_equal(pn.mass_from_pvt_batch(P, T, V, thermo), scalar)
+
+
+def test_pressure_from_mass_paths_identical(piecewise_thermo):
+    _, T, _, m = _pvt_samples()
+    volume_m3 = 2.0e5
+    args = pn.thermo_arrays(piecewise_thermo)
+    scalar = np.array(
+        [ph.pressure_from_mass(x, t, volume_m3, piecewise_thermo) for x, t in zip(m, T)]
+    )
+    compiled = np.array(
+        [pn.pressure_from_mass_nb(x, t, volume_m3, *args) for x, t in zip(m, T)]
+    )
+
+    assert np.array_equal(ph.pressure_from_mass_vec(m, T, volume_m3, piecewise_thermo), scalar)
+    assert np.array_equal(compiled, scalar)
+    assert np.array_equal(pn.pressure_from_mass_batch(m, T, volume_m3, piecewise_thermo), scalar)
+
+
+def test_linear_pressure_capped_on_all_paths(linear_thermo):
+    # Up to a * n * R * T / V = 1 - 1 / LINEAR_Z_MAX the closed form
+    # applies; beyond it (including past its pole at 1) Z is capped
+    _, T, _, m = _pvt_samples()
+    volume_m3 = 2.0e5
+    m = np.concatenate([m, [5.0e7, 1.0e8, 5.0e8]])
+    T = np.concatenate([T, [50.0, 50.0, 50.0]])
+    args = pn.thermo_arrays(linear_thermo)
+
+    scalar = np.array(
+        [ph.pressure_from_mass(x, t, volume_m3, linear_thermo) for x, t in zip(m, T)]
+    )
+    compiled = np.array(
+        [pn.pressure_from_mass_nb(x, t, volume_m3, *args) for x, t in zip(m, T)]
+    )
+    assert np.isfinite(scalar).all()
+    assert np.array_equal(ph.pressure_from_mass_vec(m, T, volume_m3, linear_thermo), scalar)
+    assert np.array_equal(compiled, scalar)
+    assert np.array_equal(pn.pressure_from_mass_batch(m, T, volume_m3, linear_thermo), scalar)
+
+    ideal_mpa = m * linear_thermo.R_over_M * (T + 273.15) / volume_m3 / 1.0e6
+    capped = linear_thermo.z_linear_a * ideal_mpa * 1.0e6 >= 1.0 - 1.0 / ph.LINEAR_Z_MAX
+    assert capped[-3:].all()
+    np.testing.assert_allclose(scalar[capped], ph.LINEAR_Z_MAX * ideal_mpa[capped], rtol=1e-12)
+
+    # mass_from_pvt uses the same capped Z, so it inverts pressure_from_mass
+    round_trip = ph.mass_from_pvt_vec(scalar, T, volume_m3, linear_thermo)
+    positive = m > 0
+    np.testing.assert_allclose(round_trip[positive], m[positive], rtol=1e-12)
+
+
+# -------------------------------------------------------------------
+# FLOAT32 VS FLOAT64
+# -------------------------------------------------------------------
+
+
+FP32_RTOL = 1.0e-5
+
+
+def test_mass_from_pvt_float32_matches_float64(piecewise_thermo):
+    P, T, V, _ = _pvt_samples()
+    m64 = ph.mass_from_pvt_vec(P, T, V, piecewise_thermo)
+    m32 = ph.mass_from_pvt_vec(P, T, V, piecewise_thermo, dtype=np.float32)
+    assert m32.dtype == np.float32
+
+    # Rounding P to float32 can move it across a segment boundary
+    same_segment = ph.get_compressibility_z_vec(
+        P.astype(np.float32), piecewise_thermo
+    ) == ph.get_compressibility_z_vec(P, piecewise_thermo)
+    assert same_segment.mean() > 0.99
+
+    residual = np.abs(m32[same_segment] - m64[same_segment]) / np.maximum(
+        m64[same_segment], 1.0
+    )
+    assert residual.max() < FP32_RTOL
+
+
+def test_pressure_from_mass_float32_matches_float64(piecewise_thermo):
+    _, T, _, m = _pvt_samples()
+    p64 = ph.pressure_from_mass_vec(m, T, 2.0e5, piecewise_thermo)
+    p32 = ph.pressure_from_mass_vec(m, T, 2.0e5, piecewise_thermo, dtype=np.float32)
+    assert p32.dtype == np.float32
+
+    same_segment = ph.get_compressibility_z_vec(
+        p32, piecewise_thermo
+    ) == ph.get_compressibility_z_vec(p64, piecewise_thermo)
+    assert same_segment.mean() > 0.99
+
+    residual = np.abs(p32[same_segment] - p64[same_segment]) / np.maximum(
+        p64[same_segment], 1.0e-6
+    )
+    assert residual.max() < FP32_RTOL